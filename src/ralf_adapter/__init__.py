@@ -3,13 +3,14 @@
 from .config import AdapterConfig
 from .grpc_server import AdapterGrpcServer, serve
 from .rest import create_app
-from .service import GenerationInput, GenerationResult, LLMAdapterService
+from .service import GenerationInput, GenerationRequest, GenerationResult, LLMAdapterService
 
 __all__ = [
     "AdapterConfig",
     "AdapterGrpcServer",
     "create_app",
     "GenerationInput",
+    "GenerationRequest",
     "GenerationResult",
     "LLMAdapterService",
     "serve",
@@ -3,13 +3,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
+import asyncio
 import base64
+import copy
 import os
 from pathlib import Path
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional
 
+import httpx
 import yaml
 
+try:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _SafeLoader
+
 from .vault import VaultSecretReference
 
 
@@ -69,6 +78,15 @@ class ModelAuthConfig:
             header_name=str(header_name) if header_name else None,
         )
 
+    def secret_values(self) -> Iterator[object]:
+        """Yield only the values ``build_headers`` resolves for this scheme."""
+
+        if self.scheme in ("bearer", "header"):
+            yield self.token
+        elif self.scheme == "basic":
+            yield self.username
+            yield self.password
+
     def build_headers(self, resolver: "SecretResolver") -> Dict[str, str]:
         if self.scheme == "bearer":
             token = resolver.resolve(self.token)
@@ -118,18 +136,19 @@ class ModelEndpointConfig:
                 f"Endpoint '{name}' timeout must be a number, got {timeout_raw!r}"
             ) from exc
 
-        headers_raw = data.get("headers", {})
-        default_params_raw = data.get("parameters", {})
-        if headers_raw and not isinstance(headers_raw, Mapping):
+        # Empty sections (``headers:`` without entries) load as None.
+        headers_raw = data.get("headers") or {}
+        default_params_raw = data.get("parameters") or {}
+        if not isinstance(headers_raw, Mapping):
             raise AdapterConfigError(f"Endpoint '{name}' headers must be a mapping")
-        if default_params_raw and not isinstance(default_params_raw, Mapping):
+        if not isinstance(default_params_raw, Mapping):
             raise AdapterConfigError(f"Endpoint '{name}' parameters must be a mapping")
 
         rate_limit_raw = data.get("rate_limit")
         auth_raw = data.get("auth")
 
-        headers = {str(key): _maybe_secret(value) for key, value in dict(headers_raw).items()}
-        parameters = dict(default_params_raw) if isinstance(default_params_raw, Mapping) else {}
+        headers = {str(key): _maybe_secret(value) for key, value in headers_raw.items()}
+        parameters = dict(default_params_raw)
         rate_limit = (
             RateLimitConfig.from_mapping(rate_limit_raw)
             if isinstance(rate_limit_raw, Mapping)
@@ -151,10 +170,19 @@ class ModelEndpointConfig:
             auth=auth,
         )
 
+    def secret_values(self) -> Iterator[object]:
+        """Yield every header and auth value that may need secret resolution."""
+
+        yield from self.headers.values()
+        if self.auth:
+            yield from self.auth.secret_values()
+
     def resolve(self, resolver: "SecretResolver") -> "ResolvedModelEndpoint":
         resolved_headers = {key: resolver.resolve(value) for key, value in self.headers.items()}
         if self.auth:
             resolved_headers.update(self.auth.build_headers(resolver))
+        if not any(key.lower() == "content-type" for key in resolved_headers):
+            resolved_headers["Content-Type"] = "application/json"
         return ResolvedModelEndpoint(
             name=self.name,
             url=self.url,
@@ -164,6 +192,8 @@ class ModelEndpointConfig:
             default_parameters=dict(self.default_parameters),
             headers=resolved_headers,
             rate_limit=self.rate_limit,
+            request_timeout=httpx.Timeout(self.timeout),
+            source=self,
         )
 
 
@@ -179,9 +209,8 @@ class ResolvedModelEndpoint:
     default_parameters: Mapping[str, Any]
     headers: Mapping[str, str]
     rate_limit: Optional[RateLimitConfig]
-
-    def build_headers(self) -> Dict[str, str]:
-        return dict(self.headers)
+    request_timeout: httpx.Timeout
+    source: Optional[ModelEndpointConfig] = field(default=None, repr=False, compare=False)
 
 
 @dataclass(slots=True)
@@ -194,13 +223,21 @@ class AdapterConfig:
 
     @classmethod
     def from_path(cls, path: Path) -> "AdapterConfig":
-        if not path.exists():
-            raise AdapterConfigError(f"Configuration file does not exist: {path}")
-        with path.open("r", encoding="utf-8") as handle:
-            data = yaml.safe_load(handle)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError as exc:
+            raise AdapterConfigError(f"Configuration file does not exist: {path}") from exc
+        data = _load_yaml_cached(str(path), stat.st_mtime_ns, stat.st_size)
         if not isinstance(data, Mapping):
             raise AdapterConfigError("Configuration root must be a mapping")
-        return cls.from_mapping(data)
+        # The cached mapping is shared between loads; hand out a private copy.
+        return cls.from_mapping(copy.deepcopy(data))
+
+    @classmethod
+    async def from_path_async(cls, path: Path) -> "AdapterConfig":
+        """Load ``path`` in a worker thread so the event loop keeps running."""
+
+        return await asyncio.to_thread(cls.from_path, path)
 
     @classmethod
     def from_mapping(cls, data: Mapping[str, Any]) -> "AdapterConfig":
@@ -231,7 +268,30 @@ class AdapterConfig:
             vaultwarden=vault_settings,
         )
 
-    def resolve(self, *, env: Mapping[str, str] | None = None) -> "ResolvedAdapterConfig":
+    def resolve(
+        self,
+        *,
+        env: Mapping[str, str] | None = None,
+        previous: "ResolvedAdapterConfig | None" = None,
+    ) -> "ResolvedAdapterConfig":
+        """Resolve all endpoints, reusing unchanged ones from ``previous``.
+
+        Endpoints whose configuration is identical to the one ``previous`` was
+        resolved from are carried over without touching Vaultwarden or the
+        environment again.
+        """
+
+        resolved: Dict[str, ResolvedModelEndpoint] = {}
+        pending: Dict[str, ModelEndpointConfig] = {}
+        for name, endpoint in self.endpoints.items():
+            reusable = previous.endpoints.get(name) if previous else None
+            if reusable is not None and reusable.source == endpoint:
+                resolved[name] = reusable
+            else:
+                pending[name] = endpoint
+        if not pending:
+            return ResolvedAdapterConfig(endpoints=resolved, default_endpoint=self.default_endpoint)
+
         env_mapping = env or os.environ
         token = None
         vault_provider = None
@@ -240,13 +300,21 @@ class AdapterConfig:
             vault_provider = SecretResolver.create_vault_provider(self.vaultwarden, token)
         resolver = SecretResolver(vault_provider=vault_provider, env=env_mapping)
         try:
-            resolved = {
-                name: endpoint.resolve(resolver) for name, endpoint in self.endpoints.items()
-            }
+            if vault_provider is not None:
+                resolver.prefetch(
+                    value
+                    for endpoint in pending.values()
+                    for value in endpoint.secret_values()
+                    if isinstance(value, VaultSecretReference)
+                )
+            for name, endpoint in pending.items():
+                resolved[name] = endpoint.resolve(resolver)
         finally:
             if vault_provider is not None:
                 vault_provider.close()
-        return ResolvedAdapterConfig(endpoints=resolved, default_endpoint=self.default_endpoint)
+        # Keep the configured endpoint order regardless of which ones were reused.
+        ordered = {name: resolved[name] for name in self.endpoints}
+        return ResolvedAdapterConfig(endpoints=ordered, default_endpoint=self.default_endpoint)
 
 
 @dataclass(slots=True)
@@ -267,6 +335,8 @@ class ResolvedAdapterConfig:
 class SecretResolver:
     """Resolve secret placeholders embedded in endpoint configuration."""
 
+    __slots__ = ("_vault_provider", "_env", "_cache")
+
     def __init__(
         self,
         *,
@@ -275,41 +345,66 @@ class SecretResolver:
     ) -> None:
         self._vault_provider = vault_provider
         self._env = env or {}
+        self._cache: Dict[object, str] = {}
 
     @staticmethod
     def create_vault_provider(
         settings: VaultwardenSettings, token: str
     ) -> "VaultwardenSecretProvider":
-        from .vault import VaultwardenSecretProvider
+        from .vault import VaultwardenSecretProvider, get_shared_client
 
-        return VaultwardenSecretProvider(settings.base_url, token)
+        client = get_shared_client(settings.base_url, token)
+        return VaultwardenSecretProvider(settings.base_url, token, client=client)
+
+    def prefetch(self, references: Iterable[VaultSecretReference]) -> None:
+        """Fetch ``references`` up front so each cipher is requested only once."""
+
+        if not self._vault_provider:
+            return
+        pending = {ref for ref in references if ref not in self._cache}
+        if pending:
+            self._cache.update(self._vault_provider.read_secrets_batch(pending))
 
     def resolve(self, value: object) -> str:
+        if isinstance(value, (VaultSecretReference, EnvSecretReference)):
+            cached = self._cache.get(value)
+            if cached is None:
+                cached = self._cache[value] = self._resolve_reference(value)
+            return cached
+        if value is None:
+            raise AdapterConfigError("Missing required secret value")
+        return str(value)
+
+    def _resolve_reference(self, value: "VaultSecretReference | EnvSecretReference") -> str:
         if isinstance(value, VaultSecretReference):
             if not self._vault_provider:
                 raise AdapterConfigError(
                     "Vaultwarden access is required to resolve vault:// references"
                 )
             return self._vault_provider.read_secret(value)
-        if isinstance(value, EnvSecretReference):
-            env_value = self._env.get(value.variable)
-            if env_value is None:
-                raise AdapterConfigError(
-                    f"Environment variable '{value.variable}' is required but not set"
-                )
-            return env_value
-        if value is None:
-            raise AdapterConfigError("Missing required secret value")
-        return str(value)
+        env_value = self._env.get(value.variable)
+        if env_value is None:
+            raise AdapterConfigError(
+                f"Environment variable '{value.variable}' is required but not set"
+            )
+        return env_value
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class EnvSecretReference:
     """Reference to a secret stored in the environment."""
 
     variable: str
 
 
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse ``path`` once per ``(mtime_ns, size)`` stamp."""
+
+    with open(path, "r", encoding="utf-8") as handle:
+        return yaml.load(handle, Loader=_SafeLoader)
+
+
 def _maybe_secret(value: object) -> object:
     if isinstance(value, str) and value.startswith("vault://"):
         try:
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict
 
 import grpc
-from google.protobuf import json_format, struct_pb2
+from google.protobuf import struct_pb2
 
 from .config import AdapterConfig
 from .service import (
@@ -20,6 +20,8 @@ from .service import (
 class AdapterGrpcServer:
     """Wraps ``LLMAdapterService`` in a gRPC transport."""
 
+    __slots__ = ("_service",)
+
     def __init__(self, service: LLMAdapterService) -> None:
         self._service = service
 
@@ -43,22 +45,36 @@ class AdapterGrpcServer:
     async def _generate(
         self, request: struct_pb2.Struct, context: grpc.aio.ServicerContext
     ) -> struct_pb2.Struct:
-        payload = json_format.MessageToDict(request, preserving_proto_field_name=True)
+        fields = request.fields
+        payload = {
+            key: _value_to_python(fields[key]) for key in _REQUEST_FIELDS if key in fields
+        }
         prompt = payload.get("prompt")
         if not isinstance(prompt, str) or not prompt:
             context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
             context.set_details("Field 'prompt' must be provided")
             return struct_pb2.Struct()
 
+        endpoint = payload.get("endpoint")
+        model = payload.get("model")
+        parameters = payload.get("parameters")
+        messages = payload.get("messages")
+        metadata = payload.get("metadata")
+        if isinstance(messages, list):
+            # Non-object entries are dropped; with none left, the service falls
+            # back to a single user message built from the prompt.
+            messages = [message for message in messages if isinstance(message, dict)] or None
+        else:
+            messages = None
+        generation_input = GenerationInput(
+            prompt=prompt,
+            endpoint=endpoint if isinstance(endpoint, str) and endpoint else None,
+            model=model if isinstance(model, str) and model else None,
+            parameters=parameters if isinstance(parameters, dict) else None,
+            messages=messages,
+            metadata=metadata if isinstance(metadata, dict) else None,
+        )
         try:
-            generation_input = GenerationInput(
-                prompt=prompt,
-                endpoint=_optional_str(payload.get("endpoint")),
-                model=_optional_str(payload.get("model")),
-                parameters=_as_mapping(payload.get("parameters")),
-                messages=_as_list_of_mappings(payload.get("messages")),
-                metadata=_as_mapping(payload.get("metadata")),
-            )
             result = await self._service.generate(generation_input)
         except RateLimitExceeded as exc:
             context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
@@ -72,24 +88,18 @@ class AdapterGrpcServer:
         return _result_to_struct(result)
 
 
-def _as_mapping(value: Any) -> Optional[Dict[str, Any]]:
-    if isinstance(value, dict):
-        return value
-    return None
-
-
-def _as_list_of_mappings(value: Any) -> Optional[list[Dict[str, Any]]]:
-    if isinstance(value, list):
-        mapped: list[Dict[str, Any]] = []
-        for item in value:
-            if isinstance(item, dict):
-                mapped.append(item)
-        return mapped if mapped else None
-    return None
+_REQUEST_FIELDS = ("prompt", "endpoint", "model", "parameters", "messages", "metadata")
 
 
-def _optional_str(value: Any) -> Optional[str]:
-    return str(value) if isinstance(value, str) and value else None
+def _value_to_python(value: struct_pb2.Value) -> Any:
+    kind = value.WhichOneof("kind")
+    if kind == "struct_value":
+        return {key: _value_to_python(item) for key, item in value.struct_value.fields.items()}
+    if kind == "list_value":
+        return [_value_to_python(item) for item in value.list_value.values]
+    if kind is None or kind == "null_value":
+        return None
+    return getattr(value, kind)
 
 
 def _result_to_struct(result: GenerationResult) -> struct_pb2.Struct:
@@ -97,15 +107,15 @@ def _result_to_struct(result: GenerationResult) -> struct_pb2.Struct:
         "text": result.text,
         "endpoint": result.endpoint,
         "latency_ms": result.latency_ms,
-        "raw": dict(result.raw),
+        "raw": result.raw,
     }
     if result.model is not None:
         payload["model"] = result.model
     if result.usage is not None:
-        payload["usage"] = dict(result.usage)
+        payload["usage"] = result.usage
 
     message = struct_pb2.Struct()
-    json_format.ParseDict(payload, message, ignore_unknown_fields=True)
+    message.update(payload)
     return message
 
 
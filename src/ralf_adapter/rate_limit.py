@@ -4,52 +4,74 @@ from __future__ import annotations
 
 import asyncio
 import time
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque
 
 
 @dataclass(slots=True)
 class RateLimiter:
-    """Token bucket limiter that works with asyncio coroutines."""
+    """Token bucket limiter that works with asyncio coroutines.
+
+    The bucket is only touched from a single event loop, so checking and
+    taking tokens needs no lock as long as no ``await`` happens in between.
+    Blocking ``acquire`` calls queue up in FIFO order instead.
+    """
 
     capacity: int
     refill_seconds: float
+    _tokens: float = field(init=False, repr=False)
+    _updated: float = field(init=False, repr=False)
+    _refill_rate: float = field(init=False, repr=False)
+    _waiters: Deque["asyncio.Future[None]"] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._tokens = float(self.capacity)
         self._updated = time.monotonic()
-        self._lock = asyncio.Lock()
+        self._refill_rate = 1.0 / self.refill_seconds
+        self._waiters = deque()
 
     @classmethod
     def per_minute(cls, requests_per_minute: int) -> "RateLimiter":
         return cls(capacity=requests_per_minute, refill_seconds=60.0 / max(requests_per_minute, 1))
 
     async def acquire(self, tokens: float = 1.0) -> None:
-        async with self._lock:
-            await self._wait_for_tokens(tokens)
-            self._tokens -= tokens
+        if not self._waiters and self._take(tokens):
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            if self._waiters[0] is not waiter:
+                await waiter
+            while not self._take(tokens):
+                await asyncio.sleep((tokens - self._tokens) * self.refill_seconds)
+        finally:
+            was_head = self._waiters[0] is waiter
+            self._waiters.remove(waiter)
+            if was_head and self._waiters and not self._waiters[0].done():
+                self._waiters[0].set_result(None)
 
     async def try_acquire(self, tokens: float = 1.0) -> bool:
-        async with self._lock:
-            self._refill()
-            if self._tokens >= tokens:
-                self._tokens -= tokens
-                return True
-            return False
-
-    async def _wait_for_tokens(self, tokens: float) -> None:
-        while True:
-            self._refill()
-            if self._tokens >= tokens:
-                return
-            missing = tokens - self._tokens
-            await asyncio.sleep(missing * self.refill_seconds)
+        # Queued ``acquire`` callers keep priority over opportunistic requests.
+        return not self._waiters and self._take(tokens)
+
+    def _take(self, tokens: float) -> bool:
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+        return False
 
     def _refill(self) -> None:
         now = time.monotonic()
+        if self._tokens >= self.capacity:
+            # Nothing to top up; just restart the clock for the next deficit.
+            self._updated = now
+            return
         delta = now - self._updated
         if delta <= 0:
             return
-        self._tokens = min(self.capacity, self._tokens + delta / self.refill_seconds)
+        self._tokens = min(self.capacity, self._tokens + delta * self._refill_rate)
         self._updated = now
 
 
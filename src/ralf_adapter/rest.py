@@ -65,13 +65,14 @@ class GenerateResponse(BaseModel):
 
     @classmethod
     def from_result(cls, result: GenerationResult) -> "GenerateResponse":
-        return cls(
+        # The result was produced by our own service, so skip re-validation.
+        return cls.model_construct(
             text=result.text,
             model=result.model,
             endpoint=result.endpoint,
             latency_ms=result.latency_ms,
-            usage=dict(result.usage) if result.usage is not None else None,
-            raw=dict(result.raw),
+            usage=result.usage,
+            raw=result.raw,
         )
 
 
@@ -92,7 +93,7 @@ def create_app(config: AdapterConfig) -> FastAPI:
     @app.post("/v1/generate", response_model=GenerateResponse, tags=["generation"])
     async def generate(payload: GeneratePayload) -> GenerateResponse:
         try:
-            result = await service.generate(payload.to_domain())
+            result = await service.generate(payload)
         except RateLimitExceeded as exc:
             raise HTTPException(status_code=429, detail=str(exc)) from exc
         except AdapterError as exc:
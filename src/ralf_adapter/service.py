@@ -2,16 +2,49 @@
 
 from __future__ import annotations
 
+import importlib.util
+import json
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Protocol
 
 import httpx
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
 from .config import AdapterConfig, ResolvedModelEndpoint
 from .rate_limit import RateLimiter
 
 
+class GenerationRequest(Protocol):
+    """Read-only view of a generation request accepted by the service.
+
+    ``GenerationInput`` and the REST ``GeneratePayload`` model both satisfy it,
+    so frontends can hand over their own request objects without converting.
+    """
+
+    @property
+    def prompt(self) -> str: ...
+
+    @property
+    def endpoint(self) -> Optional[str]: ...
+
+    @property
+    def model(self) -> Optional[str]: ...
+
+    @property
+    def parameters(self) -> Optional[Mapping[str, Any]]: ...
+
+    @property
+    def messages(self) -> Optional[List[Mapping[str, Any]]]: ...
+
+    @property
+    def metadata(self) -> Optional[Mapping[str, Any]]: ...
+
+
 @dataclass(slots=True)
 class GenerationInput:
     """Canonical representation of a generation request."""
@@ -36,6 +69,18 @@ class GenerationResult:
     raw: Mapping[str, Any]
 
 
+# LLM calls are slow and long-lived, so keep plenty of warm connections around
+# and let HTTP/2 multiplex concurrent requests when the h2 package is present.
+_CLIENT_LIMITS = httpx.Limits(
+    max_keepalive_connections=100,
+    max_connections=200,
+    keepalive_expiry=60.0,
+)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+# Enough bytes for 200 characters even if every one of them is multi-byte UTF-8.
+_ERROR_SNIPPET_BYTES = 800
+
+
 class RateLimitExceeded(RuntimeError):
     """Raised when an upstream limit would be exceeded."""
 
@@ -47,17 +92,22 @@ class AdapterError(RuntimeError):
 class LLMAdapterService:
     """High level facade for interacting with configured model endpoints."""
 
+    __slots__ = ("_config", "_resolved", "_client", "_limiters")
+
     def __init__(self, config: AdapterConfig) -> None:
         self._config = config
         self._resolved = config.resolve()
-        self._client = httpx.AsyncClient()
+        self._client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=_CLIENT_LIMITS,
+        )
         self._limiters: Dict[str, RateLimiter] = {}
         self._configure_limiters()
 
     async def aclose(self) -> None:
         await self._client.aclose()
 
-    async def generate(self, request: GenerationInput) -> GenerationResult:
+    async def generate(self, request: GenerationRequest) -> GenerationResult:
         endpoint = self._resolved.get_endpoint(request.endpoint)
         limiter = self._limiters.get(endpoint.name)
         if limiter is not None:
@@ -67,32 +117,42 @@ class LLMAdapterService:
                     f"Rate limit exceeded for endpoint '{endpoint.name}'"
                 )
 
-        payload = _build_payload(endpoint, request)
-        headers = endpoint.build_headers()
+        build_payload, extract_text = _PROTOCOL_HANDLERS.get(endpoint.protocol, _GENERIC_HANDLERS)
+        payload = build_payload(endpoint, request)
         start = time.perf_counter()
+        upstream_request = self._client.build_request(
+            "POST",
+            endpoint.url,
+            content=_dumps(payload),
+            headers=endpoint.headers,
+            # Every endpoint has a timeout (30s by default), so the client-wide
+            # timeout never applies and is left at httpx's default.
+            timeout=endpoint.request_timeout,
+        )
         try:
-            response = await self._client.post(
-                endpoint.url,
-                json=payload,
-                headers=headers,
-                timeout=endpoint.timeout,
-            )
+            response = await self._client.send(upstream_request, stream=True)
+            try:
+                if response.status_code >= 400:
+                    # Error pages can be huge; only the head ends up in the message.
+                    snippet = await _read_prefix(response, _ERROR_SNIPPET_BYTES)
+                    raise AdapterError(
+                        f"Endpoint '{endpoint.name}' returned HTTP {response.status_code}: "
+                        f"{snippet[:200]}"
+                    )
+                content = await response.aread()
+            finally:
+                await response.aclose()
         except httpx.HTTPError as exc:
             raise AdapterError(
                 f"Failed to contact endpoint '{endpoint.name}': {exc!s}"
             ) from exc
 
-        if response.status_code >= 400:
-            raise AdapterError(
-                f"Endpoint '{endpoint.name}' returned HTTP {response.status_code}: {response.text[:200]}"
-            )
-
         try:
-            data = response.json()
+            data = _loads(content)
         except ValueError as exc:  # pragma: no cover - defensive
             raise AdapterError("Endpoint response is not valid JSON") from exc
 
-        text = _extract_text(endpoint.protocol, data)
+        text = extract_text(data)
         latency_ms = int((time.perf_counter() - start) * 1000)
         model = payload.get("model") or endpoint.default_model
         usage = data.get("usage") if isinstance(data, Mapping) else None
@@ -105,11 +165,16 @@ class LLMAdapterService:
             raw=data if isinstance(data, Mapping) else {"data": data},
         )
 
-    def reload(self, config: AdapterConfig) -> None:
-        """Reload runtime configuration without creating a new instance."""
+    def reload(self, config: AdapterConfig, *, refresh_secrets: bool = False) -> None:
+        """Reload runtime configuration without creating a new instance.
+
+        Endpoints that did not change keep their already resolved secrets;
+        pass ``refresh_secrets=True`` after rotating credentials.
+        """
 
+        previous = None if refresh_secrets else self._resolved
         self._config = config
-        self._resolved = config.resolve()
+        self._resolved = config.resolve(previous=previous)
         self._configure_limiters()
 
     def _configure_limiters(self) -> None:
@@ -120,30 +185,64 @@ class LLMAdapterService:
                 self._limiters[endpoint.name] = limiter
 
 
-def _build_payload(endpoint: ResolvedModelEndpoint, request: GenerationInput) -> Dict[str, Any]:
-    params: Dict[str, Any] = dict(endpoint.default_parameters)
-    if request.parameters:
-        params.update(request.parameters)
+async def _read_prefix(response: httpx.Response, limit: int) -> str:
+    chunks: List[bytes] = []
+    size = 0
+    async for chunk in response.aiter_bytes():
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return b"".join(chunks)[:limit].decode("utf-8", errors="replace")
 
-    if endpoint.protocol == "openai":
-        model_name = request.model or endpoint.default_model
-        if not model_name:
-            raise AdapterError(
-                f"Endpoint '{endpoint.name}' requires a model to be specified"
-            )
-        messages = request.messages
-        if not messages:
-            messages = [{"role": "user", "content": request.prompt}]
-        payload: Dict[str, Any] = {
-            "model": model_name,
-            "messages": messages,
-        }
-        payload.update(params)
-        if request.metadata:
-            payload["metadata"] = request.metadata
-        return payload
-
-    payload = {"prompt": request.prompt}
+
+def _dumps(payload: Mapping[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(content: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _build_payload(endpoint: ResolvedModelEndpoint, request: GenerationRequest) -> Dict[str, Any]:
+    build_payload, _ = _PROTOCOL_HANDLERS.get(endpoint.protocol, _GENERIC_HANDLERS)
+    return build_payload(endpoint, request)
+
+
+def _build_openai_payload(
+    endpoint: ResolvedModelEndpoint, request: GenerationRequest
+) -> Dict[str, Any]:
+    model_name = request.model or endpoint.default_model
+    if not model_name:
+        raise AdapterError(
+            f"Endpoint '{endpoint.name}' requires a model to be specified"
+        )
+    messages = request.messages
+    if not messages:
+        messages = [{"role": "user", "content": request.prompt}]
+    payload: Dict[str, Any] = {
+        "model": model_name,
+        "messages": messages,
+        **endpoint.default_parameters,
+        **(request.parameters or {}),
+    }
+    if request.metadata:
+        payload["metadata"] = request.metadata
+    return payload
+
+
+def _build_generic_payload(
+    endpoint: ResolvedModelEndpoint, request: GenerationRequest
+) -> Dict[str, Any]:
+    defaults = endpoint.default_parameters
+    # Defaults are never mutated after resolve(), so they can be sent as-is
+    # unless the request brings its own overrides.
+    params = {**defaults, **request.parameters} if request.parameters else defaults
+    payload: Dict[str, Any] = {"prompt": request.prompt}
     if request.model or endpoint.default_model:
         payload["model"] = request.model or endpoint.default_model
     if params:
@@ -156,21 +255,27 @@ def _build_payload(endpoint: ResolvedModelEndpoint, request: GenerationInput) ->
 
 
 def _extract_text(protocol: str, data: Mapping[str, Any]) -> str:
-    if protocol == "openai":
-        choices = data.get("choices")
-        if isinstance(choices, list) and choices:
-            first = choices[0]
-            if isinstance(first, Mapping):
-                message = first.get("message")
-                if isinstance(message, Mapping):
-                    content = message.get("content")
-                    if isinstance(content, str):
-                        return content
-                text_value = first.get("text")
-                if isinstance(text_value, str):
-                    return text_value
-        raise AdapterError("OpenAI-compatible response did not include choices")
-
+    _, extract_text = _PROTOCOL_HANDLERS.get(protocol, _GENERIC_HANDLERS)
+    return extract_text(data)
+
+
+def _extract_openai_text(data: Mapping[str, Any]) -> str:
+    choices = data.get("choices")
+    if isinstance(choices, list) and choices:
+        first = choices[0]
+        if isinstance(first, Mapping):
+            message = first.get("message")
+            if isinstance(message, Mapping):
+                content = message.get("content")
+                if isinstance(content, str):
+                    return content
+            text_value = first.get("text")
+            if isinstance(text_value, str):
+                return text_value
+    raise AdapterError("OpenAI-compatible response did not include choices")
+
+
+def _extract_generic_text(data: Mapping[str, Any]) -> str:
     text = data.get("text")
     if isinstance(text, str):
         return text
@@ -184,9 +289,23 @@ def _extract_text(protocol: str, data: Mapping[str, Any]) -> str:
     raise AdapterError("Endpoint response did not include a text field")
 
 
+_PayloadBuilder = Callable[[ResolvedModelEndpoint, GenerationRequest], Dict[str, Any]]
+_TextExtractor = Callable[[Mapping[str, Any]], str]
+
+# Unknown protocols are treated as generic POST endpoints.
+_GENERIC_HANDLERS: tuple[_PayloadBuilder, _TextExtractor] = (
+    _build_generic_payload,
+    _extract_generic_text,
+)
+_PROTOCOL_HANDLERS: Dict[str, tuple[_PayloadBuilder, _TextExtractor]] = {
+    "openai": (_build_openai_payload, _extract_openai_text),
+    "generic": _GENERIC_HANDLERS,
+}
+
 __all__ = [
     "AdapterError",
     "GenerationInput",
+    "GenerationRequest",
     "GenerationResult",
     "LLMAdapterService",
     "RateLimitExceeded",
@@ -2,13 +2,35 @@
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import importlib.util
+import json
+import re
+import ssl
+import sys
 from dataclasses import dataclass
-from typing import Dict, Mapping
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
 import httpx
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
-@dataclass(slots=True)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+# One client per endpoint, stored with a digest of the token it was built for.
+_SHARED_CLIENTS: Dict[str, Tuple[bytes, httpx.Client]] = {}
+_CLIENT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=20,
+    keepalive_expiry=30.0,
+)
+
+
+@dataclass(slots=True, frozen=True)
 class VaultSecretReference:
     """Reference to a secret stored inside Vaultwarden."""
 
@@ -18,76 +40,113 @@ class VaultSecretReference:
 
     @classmethod
     def parse(cls, reference: str) -> "VaultSecretReference":
+        # References are frozen, so repeated strings can share one instance.
+        return _parse_cached(cls, reference)
+
+    @classmethod
+    def _parse(cls, reference: str) -> "VaultSecretReference":
         if not reference.startswith("vault://"):
             raise ValueError("Vault secret references must start with 'vault://'")
-        path = reference.removeprefix("vault://")
-        if "#" in path:
-            cipher_id, field = path.split("#", 1)
+        match = _REFERENCE_PATTERN.match(reference)
+        if match is None:
+            raise ValueError(
+                "Vault secret references must include both cipher id and field"
+            )
+        if match.group("field") is not None:
+            cipher_id, field = match.group("cipher", "field")
         else:
-            parts = path.split("/")
-            if len(parts) < 2:
-                raise ValueError(
-                    "Vault secret references must include both cipher id and field"
-                )
-            cipher_id = "/".join(parts[:-1])
-            field = parts[-1]
+            cipher_id, field = match.group("path_cipher", "path_field")
         cipher_id = cipher_id.strip()
         field = field.strip()
         if not cipher_id or not field:
             raise ValueError("Vault secret references require both cipher and field")
+        # Many references point at the same cipher; share one key string.
+        cipher_id = sys.intern(cipher_id)
         if field.startswith("field:"):
-            return cls(cipher_id=cipher_id, field=field.split(":", 1)[1], kind="field")
+            return cls(cipher_id=cipher_id, field=field[6:], kind="field")
         return cls(cipher_id=cipher_id, field=field, kind="password")
 
 
+@lru_cache(maxsize=4096)
+def _parse_cached(cls: type[VaultSecretReference], reference: str) -> VaultSecretReference:
+    return cls._parse(reference)
+
+
+# ``vault://<cipher>#<field>`` splits at the first ``#``; otherwise the last
+# ``/`` separates the (possibly nested) cipher id from the field.
+_REFERENCE_PATTERN = re.compile(
+    r"vault://(?:"
+    r"(?P<cipher>[^#]*)#(?P<field>.*)"
+    r"|(?P<path_cipher>.*)/(?P<path_field>[^/]*)"
+    r")\Z",
+    re.DOTALL,
+)
+
+
 class VaultwardenSecretProvider:
     """Small helper that fetches secret values from Vaultwarden."""
 
+    __slots__ = ("_client", "_owns_client", "_cache")
+
     def __init__(
         self,
         base_url: str,
         token: str,
         *,
         timeout: float = 10.0,
+        client: Optional[httpx.Client] = None,
     ) -> None:
-        self._client = httpx.Client(
-            base_url=base_url.rstrip("/"),
-            headers={
-                "Authorization": f"Bearer {token}",
-                "User-Agent": "ralf-adapter/0.1",
-            },
-            timeout=timeout,
+        self._owns_client = client is None
+        self._client = (
+            client if client is not None else _build_client(base_url, token, timeout=timeout)
         )
         self._cache: Dict[str, Mapping[str, object]] = {}
 
     def read_secret(self, reference: VaultSecretReference) -> str:
-        cipher = self._get_cipher(reference.cipher_id)
-        if reference.kind == "password":
-            login = cipher.get("login")
-            if not isinstance(login, Mapping) or "password" not in login:
-                raise RuntimeError(
-                    f"Cipher '{reference.cipher_id}' does not expose a login password"
-                )
-            password = login.get("password")
-            if not isinstance(password, str):
-                raise RuntimeError("Vaultwarden password must be a string")
-            return password
-        if reference.kind == "field":
-            fields = cipher.get("fields", [])
-            if not isinstance(fields, list):
-                raise RuntimeError("Vaultwarden custom fields must be stored as a list")
-            for field in fields:
-                if isinstance(field, Mapping) and field.get("name") == reference.field:
-                    value = field.get("value")
-                    if isinstance(value, str):
-                        return value
-                    raise RuntimeError(
-                        f"Vaultwarden field '{reference.field}' is not stored as text"
-                    )
-            raise RuntimeError(
-                f"Vaultwarden cipher '{reference.cipher_id}' is missing field '{reference.field}'"
-            )
-        raise RuntimeError(f"Unsupported Vault secret kind '{reference.kind}'")
+        return _extract_secret(self._get_cipher(reference.cipher_id), reference)
+
+    def read_secrets_batch(
+        self, references: Iterable[VaultSecretReference]
+    ) -> Dict[VaultSecretReference, str]:
+        """Resolve many references with a single request per cipher."""
+
+        grouped: Dict[str, List[VaultSecretReference]] = {}
+        for reference in references:
+            grouped.setdefault(reference.cipher_id, []).append(reference)
+        self.prefetch(grouped)
+        secrets: Dict[VaultSecretReference, str] = {}
+        for cipher_id, cipher_refs in grouped.items():
+            cipher = self._get_cipher(cipher_id)
+            for reference in cipher_refs:
+                secrets[reference] = _extract_secret(cipher, reference)
+        return secrets
+
+    def prefetch(self, cipher_ids: Iterable[str]) -> None:
+        """Hydrate the cipher cache for ``cipher_ids`` with a single list request.
+
+        Servers that refuse the bulk listing are left to the per-cipher lookups
+        in ``_get_cipher``.
+        """
+
+        missing = {cipher_id for cipher_id in cipher_ids if cipher_id not in self._cache}
+        if len(missing) < 2:
+            return
+        try:
+            response = self._client.get("/api/ciphers")
+        except httpx.HTTPError:
+            return
+        if response.is_error:  # e.g. 403/404 when bulk listing is not permitted
+            return
+        try:
+            payload = _loads(response.content)
+        except ValueError:
+            return
+        items = payload.get("data") if isinstance(payload, dict) else None
+        if not isinstance(items, list):
+            return
+        for item in items:
+            if isinstance(item, dict) and item.get("id") in missing:
+                self._cache[str(item["id"])] = item
 
     def _get_cipher(self, cipher_id: str) -> Mapping[str, object]:
         if cipher_id not in self._cache:
@@ -99,16 +158,17 @@ class VaultwardenSecretProvider:
                     f"Failed to fetch Vaultwarden cipher '{cipher_id}': {exc!s}"
                 ) from exc
             try:
-                payload = response.json()
+                payload = _loads(response.content)
             except ValueError as exc:
                 raise RuntimeError("Vaultwarden cipher response is not valid JSON") from exc
-            if not isinstance(payload, Mapping):
+            if not isinstance(payload, dict):
                 raise RuntimeError("Vaultwarden cipher response must be a JSON object")
             self._cache[cipher_id] = payload
         return self._cache[cipher_id]
 
     def close(self) -> None:
-        self._client.close()
+        if self._owns_client:
+            self._client.close()
 
     def __enter__(self) -> "VaultwardenSecretProvider":
         return self
@@ -117,4 +177,92 @@ class VaultwardenSecretProvider:
         self.close()
 
 
-__all__ = ["VaultSecretReference", "VaultwardenSecretProvider"]
+def _loads(content: bytes) -> object:
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
+def get_shared_client(base_url: str, token: str, *, timeout: float = 10.0) -> httpx.Client:
+    """Return a pooled client shared by all providers for ``base_url``.
+
+    Providers created with this client leave it open on ``close()`` so the
+    keep-alive connections survive across config reloads. When the token
+    changes, the client built for the previous token is closed and replaced.
+    """
+
+    key = base_url.rstrip("/")
+    fingerprint = hashlib.sha256(token.encode("utf-8")).digest()
+    entry = _SHARED_CLIENTS.get(key)
+    if entry is not None:
+        previous_fingerprint, client = entry
+        if previous_fingerprint == fingerprint and not client.is_closed:
+            return client
+        client.close()
+    client = _build_client(base_url, token, timeout=timeout)
+    _SHARED_CLIENTS[key] = (fingerprint, client)
+    return client
+
+
+@lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    # Loading the CA bundle is the expensive part of building a transport.
+    return httpx.create_ssl_context()
+
+
+def _build_client(base_url: str, token: str, *, timeout: float) -> httpx.Client:
+    # The pool lives on the transport, so limits and HTTP/2 are configured there.
+    # Transports are closed together with their client and therefore not
+    # shared; the SSL context and limits are.
+    transport = httpx.HTTPTransport(
+        verify=_ssl_context(),
+        http2=_HTTP2_AVAILABLE,
+        limits=_CLIENT_LIMITS,
+        retries=2,
+    )
+    return httpx.Client(
+        base_url=base_url.rstrip("/"),
+        headers={
+            "Authorization": f"Bearer {token}",
+            "User-Agent": "ralf-adapter/0.1",
+        },
+        timeout=timeout,
+        transport=transport,
+    )
+
+
+@atexit.register
+def _close_shared_clients() -> None:
+    for _, client in _SHARED_CLIENTS.values():
+        client.close()
+    _SHARED_CLIENTS.clear()
+
+
+def _extract_secret(cipher: Mapping[str, object], reference: VaultSecretReference) -> str:
+    if reference.kind == "password":
+        login = cipher.get("login")
+        if not isinstance(login, dict) or "password" not in login:
+            raise RuntimeError(
+                f"Cipher '{reference.cipher_id}' does not expose a login password"
+            )
+        password = login.get("password")
+        if not isinstance(password, str):
+            raise RuntimeError("Vaultwarden password must be a string")
+        return password
+    if reference.kind == "field":
+        fields = cipher.get("fields", [])
+        if not isinstance(fields, list):
+            raise RuntimeError("Vaultwarden custom fields must be stored as a list")
+        for field in fields:
+            if isinstance(field, dict) and field.get("name") == reference.field:
+                value = field.get("value")
+                if isinstance(value, str):
+                    return value
+                raise RuntimeError(
+                    f"Vaultwarden field '{reference.field}' is not stored as text"
+                )
+        raise RuntimeError(
+            f"Vaultwarden cipher '{reference.cipher_id}' is missing field '{reference.field}'"
+        )
+    raise RuntimeError(f"Unsupported Vault secret kind '{reference.kind}'")
+
+
+__all__ = ["VaultSecretReference", "VaultwardenSecretProvider", "get_shared_client"]
@@ -4,17 +4,25 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
+import functools
 import json
 import os
 import pathlib
 import shutil
 import sys
-from typing import Iterable, List, Optional
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
 
-from .config import ConfigurationError, Profile
-from .installer import ExecutionReport, Installer
-from . import docgen
-from . import n8n
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+# Subcommand dependencies (YAML loading, installer, n8n client, docgen) are
+# imported inside the handlers so that e.g. ``test-env`` or ``--help`` do not
+# pay for them.
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .installer import ExecutionReport
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -23,6 +31,7 @@ def build_parser() -> argparse.ArgumentParser:
     return _build_install_parser()
 
 
+@functools.lru_cache(maxsize=None)
 def _build_install_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="R.A.L.F. installer")
     parser.add_argument("profile", help="Path to the installer profile (YAML)")
@@ -44,6 +53,7 @@ def _build_install_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@functools.lru_cache(maxsize=None)
 def _build_workflow_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Activate workflows defined in a profile")
     parser.add_argument("profile", help="Path to the installer profile (YAML)")
@@ -62,6 +72,7 @@ def _build_workflow_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@functools.lru_cache(maxsize=None)
 def _build_report_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Aggregate policy pipeline results")
     parser.add_argument("profile", help="Path to the installer profile (YAML)")
@@ -77,6 +88,7 @@ def _build_report_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@functools.lru_cache(maxsize=None)
 def _build_n8n_flows_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Manage demo workflows in n8n")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -86,13 +98,11 @@ def _build_n8n_flows_parser() -> argparse.ArgumentParser:
         target.add_argument(
             "--url",
             dest="base_url",
-            default=os.environ.get("N8N_URL"),
             help="Base URL of the n8n REST API (defaults to $N8N_URL or http://localhost:5678/api/v1)",
         )
         target.add_argument(
             "--api-key",
             dest="api_key",
-            default=os.environ.get("N8N_API_KEY"),
             help="n8n API key (defaults to $N8N_API_KEY)",
         )
         target.add_argument(
@@ -136,6 +146,7 @@ def _build_n8n_flows_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@functools.lru_cache(maxsize=None)
 def _build_test_env_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Manage local agent test environments")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -168,22 +179,20 @@ def _build_test_env_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main(argv: Optional[list[str]] = None) -> int:
+def main(argv: list[str] | None = None) -> int:
     if argv is None:
         argv = sys.argv[1:]
 
-    if argv and argv[0] == "enable-workflows":
-        return _handle_enable_workflows(argv[1:])
-    if argv and argv[0] == "report":
-        return _handle_policy_report(argv[1:])
-    if argv and argv[0] == "n8n-flows":
-        return _handle_n8n_flows(argv[1:])
-    if argv and argv[0] == "test-env":
-        return _handle_test_env(argv[1:])
+    handler = _SUBCOMMANDS.get(argv[0]) if argv else None
+    if handler is not None:
+        return handler(argv[1:])
 
     parser = _build_install_parser()
     args = parser.parse_args(argv)
 
+    from .config import ConfigurationError, Profile
+    from .installer import Installer
+
     profile_path = pathlib.Path(args.profile)
 
     try:
@@ -201,6 +210,8 @@ def main(argv: Optional[list[str]] = None) -> int:
         _print_human(report, profile.description)
 
     if args.generate_docs:
+        from . import docgen
+
         generated = docgen.generate_documentation(
             installer,
             report,
@@ -218,6 +229,8 @@ def _handle_enable_workflows(argv: Iterable[str]) -> int:
     parser = _build_workflow_parser()
     args = parser.parse_args(list(argv))
 
+    from .config import ConfigurationError, Profile
+
     profile_path = pathlib.Path(args.profile)
     try:
         profile = Profile.load(profile_path)
@@ -225,43 +238,44 @@ def _handle_enable_workflows(argv: Iterable[str]) -> int:
         parser.error(str(exc))
         return 2
 
-    workflows = profile.workflows
-    if args.runtime != "all":
-        workflows = [wf for wf in workflows if wf.runtime == args.runtime]
-
-    if args.loops:
-        selected_loops = {loop.lower() for loop in args.loops}
-        workflows = [wf for wf in workflows if wf.loop.lower() in selected_loops]
+    want_runtime = args.runtime if args.runtime != "all" else None
+    want_loops = frozenset(loop.lower() for loop in args.loops) if args.loops else None
+    workflows = [
+        wf
+        for wf in profile.workflows
+        if (want_runtime is None or wf.runtime == want_runtime)
+        and (want_loops is None or wf.loop_key in want_loops)
+    ]
 
     if not workflows:
         print("No workflows matched the requested filters.")
         return 0
 
+    out: list[str] = []
     for workflow in workflows:
-        print(f"Activating {workflow.runtime} workflow '{workflow.name}' for loop '{workflow.loop}'")
-        print(f"  entrypoint: {workflow.entrypoint}")
+        out.append(
+            f"Activating {workflow.runtime} workflow '{workflow.name}' for loop '{workflow.loop}'\n"
+        )
+        out.append(f"  entrypoint: {workflow.entrypoint}\n")
         if workflow.description:
-            print(f"  description: {workflow.description}")
+            out.append(f"  description: {workflow.description}\n")
         if workflow.phases:
-            print("  phases:")
-            for phase in workflow.phases:
-                print(f"    - {phase}")
+            out.append("  phases:\n")
+            out.extend(f"    - {phase}\n" for phase in workflow.phases)
         if workflow.inputs:
-            print("  inputs:")
-            for item in workflow.inputs:
-                print(f"    - {item}")
+            out.append("  inputs:\n")
+            out.extend(f"    - {item}\n" for item in workflow.inputs)
         if workflow.outputs:
-            print("  outputs:")
-            for item in workflow.outputs:
-                print(f"    - {item}")
+            out.append("  outputs:\n")
+            out.extend(f"    - {item}\n" for item in workflow.outputs)
 
         if profile.scheduler:
             schedule = profile.scheduler.get_loop(workflow.loop)
             if schedule and schedule.triggers:
-                print("  triggers:")
-                for trigger in schedule.triggers:
-                    print(f"    - {trigger.describe()}")
+                out.append("  triggers:\n")
+                out.extend(f"    - {trigger.describe()}\n" for trigger in schedule.triggers)
 
+    _write_text("".join(out))
     return 0
 
 
@@ -269,6 +283,8 @@ def _handle_policy_report(argv: Iterable[str]) -> int:
     parser = _build_report_parser()
     args = parser.parse_args(list(argv))
 
+    from .config import ConfigurationError, Profile
+
     profile_path = pathlib.Path(args.profile)
     try:
         profile = Profile.load(profile_path)
@@ -276,7 +292,11 @@ def _handle_policy_report(argv: Iterable[str]) -> int:
         parser.error(str(exc))
         return 2
 
-    results_dir = pathlib.Path(args.results_dir) if args.results_dir else profile_path.parent / "policy_results"
+    # pathlib drops "./" prefixes and trailing slashes, which keeps the
+    # reported sources as "policy_results/<file>" for "./core.yaml" too.
+    results_dir = (
+        pathlib.Path(args.results_dir) if args.results_dir else profile_path.parent / "policy_results"
+    )
     try:
         results = _collect_policy_results(results_dir)
     except OSError as exc:
@@ -293,7 +313,7 @@ def _handle_policy_report(argv: Iterable[str]) -> int:
     )
 
     if args.json:
-        print(json.dumps(summary.as_dict(), indent=2))
+        _write_json(summary.as_dict())
     else:
         _print_policy_summary(summary)
 
@@ -304,6 +324,10 @@ def _handle_n8n_flows(argv: Iterable[str]) -> int:
     parser = _build_n8n_flows_parser()
     args = parser.parse_args(list(argv))
 
+    from . import n8n
+    from .config import ConfigurationError, Profile
+    from .installer import Installer
+
     profile_path = pathlib.Path(args.profile)
     try:
         profile = Profile.load(profile_path)
@@ -311,8 +335,9 @@ def _handle_n8n_flows(argv: Iterable[str]) -> int:
         parser.error(str(exc))
         return 2
 
-    base_url = args.base_url or "http://localhost:5678/api/v1"
-    api_key = args.api_key or ""
+    # Environment defaults are read per call because parsers are cached.
+    base_url = args.base_url or os.environ.get("N8N_URL") or "http://localhost:5678/api/v1"
+    api_key = args.api_key or os.environ.get("N8N_API_KEY") or ""
     if not api_key:
         parser.error("n8n API key must be provided via --api-key or N8N_API_KEY")
         return 2
@@ -407,6 +432,14 @@ def _handle_test_env(argv: Iterable[str]) -> int:
     return 2
 
 
+_SUBCOMMANDS = {
+    "enable-workflows": _handle_enable_workflows,
+    "report": _handle_policy_report,
+    "n8n-flows": _handle_n8n_flows,
+    "test-env": _handle_test_env,
+}
+
+
 def _resolve_testing_assets() -> pathlib.Path:
     current = pathlib.Path(__file__).resolve()
     for parent in current.parents:
@@ -465,104 +498,213 @@ def _destroy_test_env(target_dir: pathlib.Path) -> int:
 
 
 def _print_json(report: ExecutionReport) -> None:
-    print(json.dumps(report.as_dict(), indent=2))
+    size = (
+        len(report.planned_components)
+        + len(report.executed_components)
+        + len(report.skipped_components)
+    )
+    if size > _STREAM_JSON_THRESHOLD:
+        _write_json_streaming(report.as_dict())
+    elif orjson is not None:
+        # orjson serialises the dataclass natively, in field order (= as_dict order).
+        _write_json(report)
+    else:
+        _write_json(report.as_dict())
+
+
+# Reports listing more component names than this are emitted item by item so
+# the whole document never has to exist as one string.
+_STREAM_JSON_THRESHOLD = 500
+
+
+def _write_json_streaming(payload: dict[str, list[str]]) -> None:
+    """Write ``payload`` in the same layout as ``_dumps_pretty``, one item at a time."""
+
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+        def dumps(value: object) -> bytes:
+            return json.dumps(value).encode("utf-8")
+
+    write, flush = _stdout_bytes_writer()
+    write(b"{\n")
+    last_key = len(payload) - 1
+    for key_index, (key, values) in enumerate(payload.items()):
+        write(b"  " + dumps(key) + b": ")
+        if values:
+            write(b"[\n")
+            last_value = len(values) - 1
+            for index, value in enumerate(values):
+                write(b"    " + dumps(value) + (b",\n" if index < last_value else b"\n"))
+            write(b"  ]")
+        else:
+            write(b"[]")
+        write(b",\n" if key_index < last_key else b"\n")
+    write(b"}\n")
+    flush()
+
+
+def _write_json(payload: object) -> None:
+    _write_bytes(_dumps_pretty(payload))
+
+
+def _dumps_pretty(payload: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, indent=2) + "\n").encode("utf-8")
+
+
+def _write_bytes(data: bytes) -> None:
+    write, flush = _stdout_bytes_writer()
+    write(data)
+    flush()
+
+
+def _write_text(text: str) -> None:
+    """Encode ``text`` the way ``sys.stdout`` would and write it in one go."""
+
+    stream = sys.stdout
+    if getattr(stream, "buffer", None) is None:  # pragma: no cover - text-only stream
+        stream.write(text)
+        return
+    _write_bytes(text.encode(stream.encoding or "utf-8", stream.errors or "strict"))
+
+
+def _stdout_bytes_writer() -> tuple[Callable[[bytes], object], Callable[[], None]]:
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:  # pragma: no cover - text-only stream (e.g. captured output)
+        return (lambda data: stream.write(data.decode("utf-8"))), stream.flush
+    # Text written earlier through print() must not end up after our bytes.
+    stream.flush()
+    return buffer.write, buffer.flush
+
+
+def _load_json_file(path: str) -> object:
+    with open(path, "rb") as handle:
+        data = handle.read()
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 
 def _print_human(report: ExecutionReport, profile_description: str) -> None:
+    out: list[str] = []
     if profile_description:
-        print(profile_description)
-        print()
+        out.append(f"{profile_description}\n\n")
 
     if report.skipped_components:
-        print("Planned components (dry-run):")
-        for name in report.skipped_components:
-            print(f"  - {name}")
+        out.append("Planned components (dry-run):\n")
+        out.extend(f"  - {name}\n" for name in report.skipped_components)
     else:
-        print("Executed components:")
-        for name in report.executed_components:
-            print(f"  - {name}")
+        out.append("Executed components:\n")
+        out.extend(f"  - {name}\n" for name in report.executed_components)
+
+        executed = frozenset(report.executed_components)
+        pending = [name for name in report.planned_components if name not in executed]
+        if pending:
+            out.append("\nPending components:\n")
+            out.extend(f"  - {name}\n" for name in pending)
 
-    pending = [name for name in report.planned_components if name not in report.executed_components]
-    if pending and not report.skipped_components:
-        print("\nPending components:")
-        for name in pending:
-            print(f"  - {name}")
+    _write_text("".join(out))
+
+
+_POLICY_RESULT_KEYS = ("policy", "status", "source", "severity", "target", "details")
 
 
 @dataclasses.dataclass(slots=True)
 class PolicyResult:
     policy: str
     status: str
-    severity: Optional[str]
-    target: Optional[str]
-    details: Optional[str]
+    severity: str | None
+    target: str | None
+    details: str | None
     source: str
 
     def as_dict(self) -> dict[str, object]:
-        payload: dict[str, object] = {
-            "policy": self.policy,
-            "status": self.status,
-            "source": self.source,
+        # Optional fields are normalised to None on collection, so skipping
+        # None is enough to leave unset fields out.
+        return {
+            key: value
+            for key, value in zip(
+                _POLICY_RESULT_KEYS,
+                (self.policy, self.status, self.source, self.severity, self.target, self.details),
+            )
+            if value is not None
         }
-        if self.severity:
-            payload["severity"] = self.severity
-        if self.target:
-            payload["target"] = self.target
-        if self.details:
-            payload["details"] = self.details
-        return payload
 
 
 @dataclasses.dataclass(slots=True)
 class PolicyReportSummary:
     profile_name: str
     profile_description: str
-    results: List[PolicyResult]
+    results: list[PolicyResult]
 
     def as_dict(self) -> dict[str, object]:
         return {
             "profile": self.profile_name,
             "description": self.profile_description,
-            "results": [result.as_dict() for result in self.results],
+            "results": list(map(PolicyResult.as_dict, self.results)),
         }
 
 
-def _collect_policy_results(results_dir: pathlib.Path) -> List[PolicyResult]:
-    if not results_dir.exists():
+def _collect_policy_results(results_dir: str | os.PathLike[str]) -> list[PolicyResult]:
+    if not os.path.exists(results_dir):
         return []
-    if not results_dir.is_dir():
+    if not os.path.isdir(results_dir):
         raise ValueError(f"Policy results path '{results_dir}' is not a directory")
 
-    collected: List[PolicyResult] = []
-    for path in sorted(results_dir.glob("*.json")):
-        try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            raise ValueError(f"Invalid JSON in policy result '{path}': {exc}") from exc
-
-        if not isinstance(payload, dict):
-            raise ValueError(f"Policy result '{path}' must contain a JSON object")
-
-        policy = str(payload.get("policy") or path.stem)
-        status = str(payload.get("status", "unknown")).upper()
-        severity = payload.get("severity")
-        target = payload.get("target")
-        details = payload.get("details") or payload.get("summary")
+    with os.scandir(results_dir) as scanner:
+        entries = [
+            entry for entry in scanner if entry.name.endswith(".json") and entry.is_file()
+        ]
+    entries.sort(key=lambda entry: entry.name)
+
+    paths = [entry.path for entry in entries]
+    if len(paths) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Reads and parses are independent; map() keeps the sorted order and
+        # re-raises the first failing file in that order.
+        workers = min(32, (os.cpu_count() or 1) * 4, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            payloads = list(executor.map(_load_policy_payload, paths))
+    else:
+        payloads = [_load_policy_payload(path) for path in paths]
 
+    collected: list[PolicyResult] = []
+    for entry, path, payload in zip(entries, paths, payloads):
+        status = payload.get("status", "unknown")
         collected.append(
             PolicyResult(
-                policy=policy,
-                status=status,
-                severity=str(severity) if severity is not None else None,
-                target=str(target) if target is not None else None,
-                details=str(details) if details is not None else None,
-                source=str(path),
+                _as_str(payload.get("policy") or os.path.splitext(entry.name)[0]),
+                (status if type(status) is str else str(status)).upper(),
+                _as_str(payload.get("severity")),
+                _as_str(payload.get("target")),
+                _as_str(payload.get("details") or payload.get("summary")),
+                path,
             )
         )
-
     return collected
 
 
+def _as_str(value: object) -> str | None:
+    if value is None:
+        return None
+    text = value if type(value) is str else str(value)
+    return text or None
+
+
+def _load_policy_payload(path: str) -> dict:
+    try:
+        payload = _load_json_file(path)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Invalid JSON in policy result '{path}': {exc}") from exc
+
+    if not isinstance(payload, dict):
+        raise ValueError(f"Policy result '{path}' must contain a JSON object")
+    return payload
+
+
 def _print_policy_summary(summary: PolicyReportSummary) -> None:
     header = f"Policy pipeline report for profile '{summary.profile_name}'"
     print(header)
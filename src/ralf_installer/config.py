@@ -3,24 +3,53 @@
 from __future__ import annotations
 
 import dataclasses
+import hashlib
+import hmac
+import mmap
+import os
 import pathlib
+import pickle
+import sys
+import tempfile
+import types
 from typing import Iterable, List, Mapping, Optional
 
 import yaml
 
+try:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _SafeLoader
+
 
 class ConfigurationError(RuntimeError):
     """Raised when a configuration file is invalid."""
 
 
+# Default for required-field lookups, distinguishing "absent" from ``None``.
+_MISSING: object = object()
+
+
 @dataclasses.dataclass(slots=True)
 class Action:
-    """Describes a provider specific operation for a component."""
+    """Describes a provider specific operation for a component.
+
+    ``options`` is a read-only view (top level only); handlers can use it
+    without copying.
+    """
 
     provider: str
     operation: str
     options: Mapping[str, object]
 
+    def __post_init__(self) -> None:
+        if type(self.options) is not types.MappingProxyType:
+            self.options = types.MappingProxyType(dict(self.options))
+
+    def __reduce__(self) -> tuple[type["Action"], tuple[str, str, dict[str, object]]]:
+        # mappingproxy cannot be pickled (profile cache); rebuild from a plain dict.
+        return (type(self), (self.provider, self.operation, dict(self.options)))
+
 
 @dataclasses.dataclass(slots=True)
 class ResourceProfile:
@@ -150,10 +179,10 @@ class NodeDefinition:
         if not isinstance(data, Mapping):
             raise ConfigurationError("Each node definition must be a mapping")
 
-        try:
-            name = str(data["name"])
-        except KeyError as exc:  # pragma: no cover - defensive
-            raise ConfigurationError("Node definition is missing required field 'name'") from exc
+        name_raw = data.get("name", _MISSING)
+        if name_raw is _MISSING:  # pragma: no cover - defensive
+            raise ConfigurationError("Node definition is missing required field 'name'")
+        name = sys.intern(str(name_raw))
 
         role_raw = data.get("role", "")
         role = str(role_raw) if isinstance(role_raw, str) else str(role_raw or "")
@@ -182,31 +211,28 @@ class Component:
 
     @classmethod
     def from_mapping(cls, data: Mapping[str, object]) -> "Component":
-        try:
-            name = str(data["name"])
-            description = str(data.get("description", ""))
-            raw_tasks = data.get("tasks", [])
-            raw_depends = data.get("depends_on", [])
-            raw_actions = data.get("actions", [])
-            placement_raw = data.get("placement")
-        except KeyError as exc:  # pragma: no cover - defensive
-            raise ConfigurationError(f"Missing field in component definition: {exc}") from exc
-
-        tasks = _ensure_str_list(raw_tasks, field="tasks", component=name)
-        depends_on = _ensure_str_list(raw_depends, field="depends_on", component=name)
-        actions = _ensure_action_list(raw_actions, component=name)
-        placement = (
-            PlacementPolicy.from_mapping(placement_raw, component=name)
-            if placement_raw is not None
-            else None
-        )
+        name = data.get("name", _MISSING)
+        if name is _MISSING:  # pragma: no cover - defensive
+            raise ConfigurationError("Missing field in component definition: 'name'")
+        # Component names recur in depends_on lists; interned copies make the
+        # dependency lookups identity hits.
+        name = sys.intern(name if type(name) is str else str(name))
+
+        # Missing list fields come back as None, which the helpers map to [].
+        get = data.get
+        description = get("description", "")
+        placement_raw = get("placement")
         return cls(
-            name=name,
-            description=description,
-            tasks=tasks,
-            depends_on=depends_on,
-            actions=actions,
-            placement=placement,
+            name,
+            description if type(description) is str else str(description),
+            _intern_str_list(_ensure_str_list(get("tasks"), field="tasks", component=name)),
+            _intern_str_list(
+                _ensure_str_list(get("depends_on"), field="depends_on", component=name)
+            ),
+            _ensure_action_list(get("actions"), component=name),
+            None
+            if placement_raw is None
+            else PlacementPolicy.from_mapping(placement_raw, component=name),
         )
 
 
@@ -226,21 +252,36 @@ class Profile:
         if not path.exists():
             raise ConfigurationError(f"Profile file does not exist: {path}")
 
-        with path.open("r", encoding="utf-8") as handle:
-            payload = yaml.safe_load(handle)
+        # Parsed profiles are cached on disk by file identity (path, mtime, size);
+        # an unchanged profile skips YAML parsing entirely.
+        stat = path.stat()
+        cache_file = _profile_cache_file(path, stat)
+        cached = _read_profile_cache(cache_file) if cache_file is not None else None
+        if cached is not None:
+            return cached
+
+        profile = cls._parse(path)
+        if cache_file is not None:
+            _write_profile_cache(cache_file, profile)
+        return profile
+
+    @classmethod
+    def _parse(cls, path: pathlib.Path) -> "Profile":
+        payload = _load_yaml_file(path)
 
         if not isinstance(payload, Mapping):
             raise ConfigurationError("Profile file must define a mapping at the top level")
 
-        try:
-            name = str(payload["name"])
-            description = str(payload.get("description", ""))
-            components_raw = payload.get("components", [])
-            nodes_raw = payload.get("nodes", [])
-            workflows_raw = payload.get("workflows", [])
-            scheduler_raw = payload.get("scheduler")
-        except KeyError as exc:  # pragma: no cover - defensive
-            raise ConfigurationError(f"Profile missing required field: {exc}") from exc
+        get = payload.get
+        name_raw = get("name", _MISSING)
+        if name_raw is _MISSING:
+            raise ConfigurationError("Profile missing required field: 'name'")
+        name = str(name_raw)
+        description = str(get("description", ""))
+        components_raw = get("components", [])
+        nodes_raw = get("nodes", [])
+        workflows_raw = get("workflows", [])
+        scheduler_raw = get("scheduler")
 
         components = [_component_from_obj(obj) for obj in components_raw]
         nodes = [_node_from_obj(obj) for obj in nodes_raw]
@@ -256,39 +297,205 @@ class Profile:
         )
 
     def resolve_dependencies(self) -> List[Component]:
-        """Return components sorted according to their dependencies."""
+        """Return components sorted according to their dependencies.
+
+        Depth-first post-order like the original recursive walk, but driven by
+        an explicit stack so deep dependency chains cannot hit the recursion
+        limit.
+        """
 
         by_name = {component.name: component for component in self.components}
         resolved: List[Component] = []
         visiting: set[str] = set()
         visited: set[str] = set()
 
-        def visit(component: Component) -> None:
-            if component.name in visited:
-                return
-            if component.name in visiting:
-                raise ConfigurationError(
-                    f"Circular dependency detected involving '{component.name}'"
-                )
-            visiting.add(component.name)
-            for dependency in component.depends_on:
-                try:
-                    dependency_component = by_name[dependency]
-                except KeyError as exc:
-                    raise ConfigurationError(
-                        f"Component '{component.name}' depends on unknown component '{dependency}'"
-                    ) from exc
-                visit(dependency_component)
-            visiting.remove(component.name)
-            visited.add(component.name)
-            resolved.append(component)
-
-        for component in self.components:
-            visit(component)
+        for root in self.components:
+            if root.name in visited:
+                continue
+            visiting.add(root.name)
+            stack = [(root, iter(root.depends_on))]
+            while stack:
+                component, dependencies = stack[-1]
+                for dependency in dependencies:
+                    try:
+                        dependency_component = by_name[dependency]
+                    except KeyError as exc:
+                        raise ConfigurationError(
+                            f"Component '{component.name}' depends on unknown component '{dependency}'"
+                        ) from exc
+                    if dependency_component.name in visited:
+                        continue
+                    if dependency_component.name in visiting:
+                        raise ConfigurationError(
+                            f"Circular dependency detected involving '{dependency_component.name}'"
+                        )
+                    visiting.add(dependency_component.name)
+                    stack.append((dependency_component, iter(dependency_component.depends_on)))
+                    break
+                else:
+                    stack.pop()
+                    visiting.remove(component.name)
+                    visited.add(component.name)
+                    resolved.append(component)
 
         return resolved
 
 
+# Below one page a plain read is cheaper than setting up a mapping.
+_MMAP_THRESHOLD = mmap.PAGESIZE
+
+
+def _load_yaml_file(path: pathlib.Path) -> object:
+    # libyaml decodes the UTF-8 bytes itself; no TextIOWrapper in between.
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size < _MMAP_THRESHOLD:
+            return yaml.load(handle.read(), Loader=_SafeLoader)
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return yaml.load(mapped, Loader=_SafeLoader)
+
+
+_PROFILE_CACHE_VERSION = 1
+
+
+def _module_stamp() -> str:
+    # Pickles hold this module's dataclasses; any code change invalidates them.
+    try:
+        stat = os.stat(__file__)
+    except OSError:  # pragma: no cover - e.g. zipimport
+        return "0"
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+_MODULE_STAMP = _module_stamp()
+
+
+def _profile_cache_file(path: pathlib.Path, stat: os.stat_result) -> Optional[pathlib.Path]:
+    """Return the cache location for ``path`` or ``None`` if caching is disabled.
+
+    ``RALF_CACHE_DIR`` overrides the cache directory; an empty value disables
+    the cache.
+    """
+
+    cache_dir = os.environ.get("RALF_CACHE_DIR")
+    if cache_dir is None:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        cache_dir = os.path.join(base, "ralf")
+    elif not cache_dir:
+        return None
+
+    # ``profile-<path digest>-<state digest>.pkl``: the path part lets a new
+    # entry replace the stale ones of the same profile file.
+    resolved = str(path.resolve())
+    path_digest = hashlib.sha256(resolved.encode("utf-8")).hexdigest()[:16]
+    state = f"{_PROFILE_CACHE_VERSION}:{_MODULE_STAMP}:{stat.st_mtime_ns}:{stat.st_size}"
+    state_digest = hashlib.sha256(state.encode("utf-8")).hexdigest()[:16]
+    return pathlib.Path(cache_dir) / f"profile-{path_digest}-{state_digest}.pkl"
+
+
+# Entries are ``HMAC-SHA256(key, body) + body``. The key lives next to the
+# entries and is only readable by the owner, so a pickle that was not written
+# by this user is never unpickled.
+_PROFILE_CACHE_KEY_NAME = "key"
+_PROFILE_CACHE_KEY_SIZE = 32
+_PROFILE_CACHE_SIGNATURE_SIZE = hashlib.sha256().digest_size
+
+
+def _is_private(path: pathlib.Path) -> bool:
+    """Return whether ``path`` is owned by the current user and not writable by others."""
+
+    getuid = getattr(os, "getuid", None)
+    if getuid is None:  # pragma: no cover - no ownership model to check against
+        return False
+    try:
+        stat = os.lstat(path)
+    except OSError:
+        return False
+    return stat.st_uid == getuid() and not stat.st_mode & 0o022
+
+
+def _profile_cache_key(cache_dir: pathlib.Path, create: bool) -> Optional[bytes]:
+    key_file = cache_dir / _PROFILE_CACHE_KEY_NAME
+    if create:
+        try:
+            fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            pass
+        else:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(os.urandom(_PROFILE_CACHE_KEY_SIZE))
+    if not _is_private(key_file):
+        return None
+    try:
+        key = key_file.read_bytes()
+    except OSError:
+        return None
+    return key if len(key) == _PROFILE_CACHE_KEY_SIZE else None
+
+
+def _read_profile_cache(cache_file: pathlib.Path) -> Optional[Profile]:
+    cache_dir = cache_file.parent
+    if not _is_private(cache_dir) or not _is_private(cache_file):
+        return None
+    key = _profile_cache_key(cache_dir, create=False)
+    if key is None:
+        return None
+    try:
+        data = cache_file.read_bytes()
+    except OSError:
+        return None
+    signature = data[:_PROFILE_CACHE_SIGNATURE_SIZE]
+    body = data[_PROFILE_CACHE_SIGNATURE_SIZE:]
+    if not hmac.compare_digest(signature, hmac.digest(key, body, "sha256")):
+        return None
+    try:
+        version, profile = pickle.loads(body)
+    except Exception:  # pragma: no cover - entries from an incompatible build are ignored
+        return None
+    if version != _PROFILE_CACHE_VERSION or not isinstance(profile, Profile):
+        return None
+    return profile
+
+
+def _write_profile_cache(cache_file: pathlib.Path, profile: Profile) -> None:
+    # The cache is an optimisation only; any filesystem problem just skips it.
+    cache_dir = cache_file.parent
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not _is_private(cache_dir):
+            return
+        key = _profile_cache_key(cache_dir, create=True)
+        if key is None:
+            return
+        body = pickle.dumps((_PROFILE_CACHE_VERSION, profile), protocol=5)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, prefix=".profile-")
+    except (OSError, pickle.PicklingError, TypeError):  # pragma: no cover - read-only home
+        return
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(hmac.digest(key, body, "sha256"))
+            handle.write(body)
+        os.replace(tmp_name, cache_file)
+    except OSError:  # pragma: no cover - defensive
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        return
+    _prune_profile_cache(cache_file)
+
+
+def _prune_profile_cache(cache_file: pathlib.Path) -> None:
+    # Earlier states of the same profile file can never be hit again.
+    path_prefix = cache_file.name.rsplit("-", 1)[0]
+    for stale in cache_file.parent.glob(f"{path_prefix}-*.pkl"):
+        if stale.name != cache_file.name:
+            try:
+                stale.unlink()
+            except OSError:  # pragma: no cover - concurrently removed
+                pass
+
+
 def _component_from_obj(obj: object) -> Component:
     if not isinstance(obj, Mapping):
         raise ConfigurationError("Each component entry must be a mapping")
@@ -313,15 +520,26 @@ class WorkflowTemplate:
     inputs: List[str]
     outputs: List[str]
     phases: List[str]
+    loop_key: str = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Case-insensitive loop filters compare against this instead of lowering per call.
+        self.loop_key = self.loop.lower()
 
     @classmethod
     def from_mapping(cls, data: Mapping[str, object]) -> "WorkflowTemplate":
-        try:
-            name = str(data["name"])
-            loop = str(data["loop"])
-            runtime = str(data["runtime"])
-        except KeyError as exc:  # pragma: no cover - defensive
-            raise ConfigurationError(f"Workflow definition is missing required field: {exc}") from exc
+        get = data.get
+        name_raw = get("name", _MISSING)
+        loop_raw = get("loop", _MISSING)
+        runtime_raw = get("runtime", _MISSING)
+        if name_raw is _MISSING or loop_raw is _MISSING or runtime_raw is _MISSING:
+            field = (
+                "name" if name_raw is _MISSING else "loop" if loop_raw is _MISSING else "runtime"
+            )
+            raise ConfigurationError(f"Workflow definition is missing required field: '{field}'")
+        name = str(name_raw)
+        loop = str(loop_raw)
+        runtime = str(runtime_raw)
 
         entrypoint_raw = data.get("entrypoint", name)
         description_raw = data.get("description", "")
@@ -335,10 +553,11 @@ class WorkflowTemplate:
         outputs = _ensure_str_list(outputs_raw, field="outputs", component=name)
         phases = _ensure_str_list(phases_raw, field="phases", component=name)
 
+        # Few distinct loops and runtimes are shared by many workflows.
         return cls(
             name=name,
-            loop=loop,
-            runtime=runtime.lower(),
+            loop=sys.intern(loop),
+            runtime=sys.intern(runtime.lower()),
             entrypoint=entrypoint,
             description=description,
             inputs=inputs,
@@ -361,6 +580,17 @@ class IntervalTrigger:
     expression: Optional[str] = None
     interval: Optional[str] = None
     timezone: Optional[str] = None
+    _description: str = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Triggers are not modified after loading; render the description once.
+        if self.kind == "cron" and self.expression:
+            base = f"cron '{self.expression}'"
+        elif self.kind == "timer" and self.interval:
+            base = f"timer every {self.interval}"
+        else:  # pragma: no cover - defensive
+            base = self.kind
+        self._description = f"{base} ({self.timezone})" if self.timezone else base
 
     @classmethod
     def from_mapping(cls, data: Mapping[str, object], *, loop: str, index: int) -> "IntervalTrigger":
@@ -372,7 +602,9 @@ class IntervalTrigger:
 
         kind = kind_raw.lower()
         timezone_raw = data.get("timezone")
-        timezone = str(timezone_raw) if isinstance(timezone_raw, str) and timezone_raw else None
+        timezone = (
+            sys.intern(str(timezone_raw)) if isinstance(timezone_raw, str) and timezone_raw else None
+        )
 
         if kind == "cron":
             expression = data.get("expression")
@@ -403,15 +635,7 @@ class IntervalTrigger:
     def describe(self) -> str:
         """Return a human readable representation of the trigger."""
 
-        if self.kind == "cron" and self.expression:
-            base = f"cron '{self.expression}'"
-        elif self.kind == "timer" and self.interval:
-            base = f"timer every {self.interval}"
-        else:  # pragma: no cover - defensive
-            base = self.kind
-        if self.timezone:
-            return f"{base} ({self.timezone})"
-        return base
+        return self._description
 
 
 @dataclasses.dataclass(slots=True)
@@ -467,7 +691,16 @@ class Scheduler:
         for loop_name, loop_data in loops_raw.items():
             loops[str(loop_name)] = LoopSchedule.from_mapping(str(loop_name), loop_data)
 
-        return cls(loops=loops)
+        return cls(loops=types.MappingProxyType(loops))
+
+    def __post_init__(self) -> None:
+        # Read-only view; the schedule is shared by every workflow of a loop.
+        if type(self.loops) is not types.MappingProxyType:
+            self.loops = types.MappingProxyType(dict(self.loops))
+
+    def __reduce__(self) -> tuple[type["Scheduler"], tuple[dict[str, LoopSchedule]]]:
+        # mappingproxy cannot be pickled (profile cache); rebuild from a plain dict.
+        return (type(self), (dict(self.loops),))
 
     def get_loop(self, loop: str) -> Optional[LoopSchedule]:
         """Return the schedule for a loop if configured."""
@@ -480,16 +713,32 @@ def _ensure_str_list(value: object, *, field: str, component: str) -> List[str]:
         return []
     if isinstance(value, str):
         return [value]
-    if isinstance(value, Iterable) and not isinstance(value, (bytes, bytearray)):
-        result: List[str] = []
-        for item in value:
-            if not isinstance(item, str):
-                raise ConfigurationError(
-                    f"Component '{component}' field '{field}' must contain only strings"
-                )
-            result.append(item)
-        return result
-    raise ConfigurationError(f"Component '{component}' field '{field}' must be a list of strings")
+    if type(value) is list:
+        # YAML sequences arrive as plain lists of str; validate and copy in C.
+        result = value.copy()
+    elif isinstance(value, Iterable) and not isinstance(value, (bytes, bytearray)):
+        result = [*value]
+    else:
+        raise ConfigurationError(
+            f"Component '{component}' field '{field}' must be a list of strings"
+        )
+    if not all(type(item) is str for item in result) and not all(
+        isinstance(item, str) for item in result
+    ):
+        raise ConfigurationError(
+            f"Component '{component}' field '{field}' must contain only strings"
+        )
+    return result
+
+
+def _intern_str_list(values: List[str]) -> List[str]:
+    # sys.intern only accepts exact str instances.
+    intern = sys.intern
+    return [intern(value if type(value) is str else str(value)) for value in values]
+
+
+# Shared by every action without options; Action keeps mapping proxies as-is.
+_EMPTY_OPTIONS: Mapping[str, object] = types.MappingProxyType({})
 
 
 def _ensure_action_list(value: object, *, component: str) -> List[Action]:
@@ -504,22 +753,27 @@ def _ensure_action_list(value: object, *, component: str) -> List[Action]:
                 raise ConfigurationError(
                     "Component '%s' action entry %s must be a mapping" % (component, index)
                 )
-            provider = item.get("provider")
-            operation = item.get("operation")
-            options = item.get("options", {})
-            if not isinstance(provider, str) or not provider:
-                raise ConfigurationError(
-                    f"Component '{component}' action {index} is missing a provider"
-                )
-            if not isinstance(operation, str) or not operation:
-                raise ConfigurationError(
-                    f"Component '{component}' action {index} is missing an operation"
-                )
+            get = item.get
+            provider = get("provider")
+            operation = get("operation")
+            options = get("options", _EMPTY_OPTIONS)
+            if not (provider and operation and type(provider) is str and type(operation) is str):
+                # Slow path: str subclasses are fine, anything else names the culprit.
+                if not isinstance(provider, str) or not provider:
+                    raise ConfigurationError(
+                        f"Component '{component}' action {index} is missing a provider"
+                    )
+                if not isinstance(operation, str) or not operation:
+                    raise ConfigurationError(
+                        f"Component '{component}' action {index} is missing an operation"
+                    )
+                provider = str(provider)
+                operation = str(operation)
             if not isinstance(options, Mapping):
                 raise ConfigurationError(
                     f"Component '{component}' action {index} options must be a mapping"
                 )
-            result.append(Action(provider=provider, operation=operation, options=options))
+            result.append(Action(sys.intern(provider), sys.intern(operation), options))
         return result
     raise ConfigurationError(
         f"Component '{component}' field 'actions' must be a mapping or list of mappings"
@@ -3,17 +3,43 @@
 from __future__ import annotations
 
 import datetime as _dt
+import hashlib
 import html
+import os
 import pathlib
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence
+from functools import lru_cache
+from typing import Callable, List, Mapping, Protocol, Sequence
 
-from .config import Component, NodeDefinition, PlacementPolicy, Profile, WorkflowTemplate
+from .config import Action, Component, NodeDefinition, PlacementPolicy, Profile, WorkflowTemplate
 from .explainability import VectorBootstrapSummary
 from .installer import ExecutionReport, Installer, LoopScheduleSummary, RetentionPolicy
 
 
+_SLUG_PATTERN = re.compile(r"[^a-zA-Z0-9]+")
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _current_umask() -> int:
+    # os.umask can only be read by setting it; do that once, before any threads.
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# mkstemp creates 0600 files; documents get the usual umask-based mode instead.
+_UMASK = _current_umask()
+
+
+@lru_cache(maxsize=4096)
+def _escape(value: str) -> str:
+    # Names and labels repeat across sections; cleared after every generation run.
+    return html.escape(value)
+
+
 @dataclass(slots=True)
 class _DocumentationContext:
     """Aggregated information required for report rendering."""
@@ -28,6 +54,15 @@ class _DocumentationContext:
     retention: Sequence[RetentionPolicy]
     vector_bootstrap: Sequence[VectorBootstrapSummary]
     profile_path: pathlib.Path | None
+    # Plain-text table cells, formatted once and shared by both renderers.
+    component_rows: Sequence[Sequence[str]] = ()
+    node_rows: Sequence[Sequence[str]] = ()
+    workflow_rows: Sequence[Sequence[str]] = ()
+    retention_rows: Sequence[Sequence[str]] = ()
+    # Header strings, likewise computed once per generation run.
+    timestamp_markdown: str = ""
+    timestamp_html: str = ""
+    origin: str = ""
 
 
 def generate_documentation(
@@ -51,392 +86,446 @@ def generate_documentation(
     profile_path:
         Optional filesystem path to the profile that was processed. Embedded in
         the generated output for traceability.
+
+    A ``<slug>.hash`` sidecar records a digest of the inputs; when it matches and
+    both documents exist, they are returned without being regenerated.
     """
 
     target_dir = pathlib.Path(output_dir) if output_dir else pathlib.Path("docs") / "generated"
     target_dir.mkdir(parents=True, exist_ok=True)
 
-    now = _dt.datetime.now(tz=_dt.timezone.utc)
     profile = installer.profile
+    slug = _slugify(profile.name)
+    markdown_path = target_dir / f"{slug}.md"
+    html_path = target_dir / f"{slug}.html"
+    hash_path = target_dir / f"{slug}.hash"
+
+    # Unchanged inputs keep the previously generated documents (and timestamp).
+    origin = _format_profile_origin(profile_path, profile.name)
+    digest = _input_digest(profile, report, origin)
+    if markdown_path.exists() and html_path.exists() and _read_digest(hash_path) == digest:
+        return [markdown_path, html_path]
+    hash_path.unlink(missing_ok=True)
+
+    now = _dt.datetime.now(tz=_dt.timezone.utc)
+    plan = tuple(installer.plan())
+    nodes = tuple(profile.nodes)
+    workflows = tuple(profile.workflows)
+    retention = tuple(installer.describe_retention_policies())
     context = _DocumentationContext(
         profile=profile,
         report=report,
         generated_at=now,
-        plan=installer.plan(),
-        nodes=tuple(profile.nodes),
-        workflows=tuple(profile.workflows),
+        plan=plan,
+        nodes=nodes,
+        workflows=workflows,
         schedules=tuple(installer.describe_loop_schedules()),
-        retention=tuple(installer.describe_retention_policies()),
+        retention=retention,
         vector_bootstrap=tuple(installer.describe_vector_bootstrap()),
         profile_path=profile_path,
+        timestamp_markdown=now.strftime("%Y-%m-%d %H:%M:%S %Z"),
+        timestamp_html=now.isoformat(),
+        origin=origin,
+        component_rows=[
+            (
+                component.name,
+                component.description or "—",
+                _format_tasks(component.tasks),
+                _format_dependencies(component.depends_on),
+                _format_actions(component.actions),
+                _describe_placement(component.placement),
+            )
+            for component in plan
+        ],
+        node_rows=[
+            (
+                node.name,
+                node.role or "—",
+                _format_mapping(node.labels) or "—",
+                _describe_resources(node.capacity),
+            )
+            for node in nodes
+        ],
+        workflow_rows=[
+            (
+                workflow.name,
+                workflow.loop,
+                workflow.runtime,
+                workflow.description or "—",
+                _format_list(workflow.inputs),
+                _format_list(workflow.outputs),
+                _format_list(workflow.phases),
+            )
+            for workflow in workflows
+        ],
+        retention_rows=[
+            (entry.component, entry.subject, entry.value, entry.provider or "—")
+            for entry in retention
+        ],
     )
 
-    slug = _slugify(profile.name)
-    markdown_path = target_dir / f"{slug}.md"
-    html_path = target_dir / f"{slug}.html"
+    # The context is read-only, so both documents render side by side; the file
+    # writes of one overlap with the rendering of the other.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(_write_document, markdown_path, _render_markdown, context),
+            executor.submit(_write_document, html_path, _render_html, context),
+        ]
+        try:
+            for future in futures:
+                future.result()
+        finally:
+            _escape.cache_clear()
+    hash_path.write_text(digest, encoding="utf-8")
 
-    markdown = _render_markdown(context)
-    html_output = _render_html(context)
+    return [markdown_path, html_path]
 
-    markdown_path.write_text(markdown, encoding="utf-8")
-    html_path.write_text(html_output, encoding="utf-8")
 
-    return [markdown_path, html_path]
+def _source_stamp() -> str:
+    # Output depends on this renderer and on the describe_*/as_dict code it
+    # calls; a change to any of these modules must invalidate generated documents.
+    from . import config, explainability, installer, planner, providers
+    from .providers import proxmox, services
+
+    stamps = []
+    for module_file in (
+        __file__,
+        config.__file__,
+        explainability.__file__,
+        installer.__file__,
+        planner.__file__,
+        providers.__file__,
+        proxmox.__file__,
+        services.__file__,
+    ):
+        try:
+            stat = os.stat(module_file)
+        except (OSError, TypeError):  # pragma: no cover - e.g. zipimport
+            stamps.append("0")
+        else:
+            stamps.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+    return ";".join(stamps)
+
+
+_SOURCE_STAMP = _source_stamp()
+
+
+def _input_digest(profile: Profile, report: ExecutionReport, origin: str) -> str:
+    # The dataclass reprs cover every field the renderers read.
+    payload = repr((_SOURCE_STAMP, profile, report, origin))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _read_digest(path: pathlib.Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _write_document(
+    path: pathlib.Path,
+    renderer: Callable[[_DocumentationContext, Callable[[str], object]], None],
+    context: _DocumentationContext,
+) -> None:
+    # Renderers stream into a sibling temp file (no full-document string in
+    # memory) that replaces the target only once rendering succeeded, so a
+    # failure never leaves a truncated document behind.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with open(fd, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as handle:
+            renderer(context, handle.write)
+        os.chmod(tmp_name, 0o666 & ~_UMASK)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
 
 
 def _slugify(value: str) -> str:
-    slug = re.sub(r"[^a-zA-Z0-9]+", "-", value).strip("-").lower()
+    slug = _SLUG_PATTERN.sub("-", value).strip("-").lower()
     return slug or "profile-report"
 
 
-def _render_markdown(context: _DocumentationContext) -> str:
+def _render_markdown(context: _DocumentationContext, w: Callable[[str], object]) -> None:
     profile = context.profile
-    lines: List[str] = []
-    timestamp = context.generated_at.strftime("%Y-%m-%d %H:%M:%S %Z")
-
-    lines.append(f"# Installer Report: {profile.name}")
-    lines.append("")
-    origin = _format_profile_origin(context.profile_path, profile.name)
-    lines.append(f"_Erstellt am {timestamp} – Profil: {origin}_")
-    lines.append("")
+    w(f"# Installer Report: {profile.name}\n")
+    w("\n")
+    w(f"_Erstellt am {context.timestamp_markdown} – Profil: {context.origin}_\n")
+    w("\n")
     if profile.description:
-        lines.append(profile.description)
-        lines.append("")
-
-    lines.append("## Ausführungsübersicht")
-    lines.append("")
-    lines.extend(
-        _render_markdown_summary_list(
-            "Geplante Komponenten",
-            context.report.planned_components,
-        )
-    )
-    lines.extend(
-        _render_markdown_summary_list(
-            "Ausgeführte Komponenten",
-            context.report.executed_components,
-        )
-    )
-    lines.extend(
-        _render_markdown_summary_list(
-            "Übersprungene Komponenten",
-            context.report.skipped_components,
-        )
+        w(f"{profile.description}\n")
+        w("\n")
+
+    w("## Ausführungsübersicht\n")
+    w("\n")
+    report = context.report
+    w(
+        _render_markdown_summary_list("Geplante Komponenten", report.planned_components)
+        + _render_markdown_summary_list("Ausgeführte Komponenten", report.executed_components)
+        + _render_markdown_summary_list("Übersprungene Komponenten", report.skipped_components)
+        + "\n"
     )
-    lines.append("")
 
-    lines.append("## Komponenten")
-    lines.append("")
+    w("## Komponenten\n")
+    w("\n")
     component_rows = [
-        [
-            component.name,
-            component.description or "—",
-            _markdown_multiline(_format_tasks(component.tasks)),
-            _markdown_multiline(_format_dependencies(component.depends_on)),
-            _markdown_multiline(_format_actions(component.actions)),
-            _markdown_multiline(_describe_placement(component.placement)),
-        ]
-        for component in context.plan
+        (name, description, *map(_markdown_multiline, details))
+        for name, description, *details in context.component_rows
     ]
-    lines.extend(_markdown_table(["Name", "Beschreibung", "Aufgaben", "Abhängigkeiten", "Aktionen", "Platzierung"], component_rows))
-    lines.append("")
+    _markdown_table(
+        w,
+        ["Name", "Beschreibung", "Aufgaben", "Abhängigkeiten", "Aktionen", "Platzierung"],
+        component_rows,
+    )
+    w("\n")
 
-    lines.append("## Knoten & Ressourcen")
-    lines.append("")
+    w("## Knoten & Ressourcen\n")
+    w("\n")
     if context.nodes:
         node_rows = [
-            [
-                node.name,
-                node.role or "—",
-                _markdown_multiline(_format_mapping(node.labels) or "—"),
-                _markdown_multiline(_describe_resources(node.capacity)),
-            ]
-            for node in context.nodes
+            (name, role, *map(_markdown_multiline, details))
+            for name, role, *details in context.node_rows
         ]
-        lines.extend(_markdown_table(["Name", "Rolle", "Labels", "Kapazität"], node_rows))
+        _markdown_table(w, ["Name", "Rolle", "Labels", "Kapazität"], node_rows)
     else:
-        lines.append("_Keine dedizierten Knoten im Profil hinterlegt._")
-    lines.append("")
+        w("_Keine dedizierten Knoten im Profil hinterlegt._\n")
+    w("\n")
 
-    lines.append("## Workflow-Vorlagen")
-    lines.append("")
+    w("## Workflow-Vorlagen\n")
+    w("\n")
     if context.workflows:
         workflow_rows = [
-            [
-                workflow.name,
-                workflow.loop,
-                workflow.runtime,
-                workflow.description or "—",
-                _markdown_multiline(_format_list(workflow.inputs)),
-                _markdown_multiline(_format_list(workflow.outputs)),
-                _markdown_multiline(_format_list(workflow.phases)),
-            ]
-            for workflow in context.workflows
+            (name, loop, runtime, description, *map(_markdown_multiline, details))
+            for name, loop, runtime, description, *details in context.workflow_rows
         ]
-        lines.extend(
-            _markdown_table(
-                ["Name", "Loop", "Runtime", "Beschreibung", "Inputs", "Outputs", "Phasen"],
-                workflow_rows,
-            )
+        _markdown_table(
+            w,
+            ["Name", "Loop", "Runtime", "Beschreibung", "Inputs", "Outputs", "Phasen"],
+            workflow_rows,
         )
     else:
-        lines.append("_Keine Workflow-Vorlagen definiert._")
-    lines.append("")
+        w("_Keine Workflow-Vorlagen definiert._\n")
+    w("\n")
 
-    lines.append("## Loop-Trigger")
-    lines.append("")
+    w("## Loop-Trigger\n")
+    w("\n")
     if context.schedules:
         for schedule in context.schedules:
-            lines.append(f"- **{schedule.loop}** ({schedule.description or 'ohne Beschreibung'})")
+            w(f"- **{schedule.loop}** ({schedule.description or 'ohne Beschreibung'})\n")
             if schedule.triggers:
                 for trigger in schedule.triggers:
-                    lines.append(f"  - {trigger}")
+                    w(f"  - {trigger}\n")
             else:
-                lines.append("  - _Keine Trigger konfiguriert._")
+                w("  - _Keine Trigger konfiguriert._\n")
     else:
-        lines.append("_Keine Scheduler-Informationen vorhanden._")
-    lines.append("")
+        w("_Keine Scheduler-Informationen vorhanden._\n")
+    w("\n")
 
-    lines.append("## Retention Policies")
-    lines.append("")
+    w("## Retention Policies\n")
+    w("\n")
     if context.retention:
-        retention_rows = [
-            [entry.component, entry.subject, entry.value, entry.provider or "—"]
-            for entry in context.retention
-        ]
-        lines.extend(_markdown_table(["Komponente", "Feld", "Wert", "Provider"], retention_rows))
+        _markdown_table(w, ["Komponente", "Feld", "Wert", "Provider"], context.retention_rows)
     else:
-        lines.append("_Keine Retention-Parameter entdeckt._")
-    lines.append("")
+        w("_Keine Retention-Parameter entdeckt._\n")
+    w("\n")
 
-    lines.append("## Vector-Bootstrap")
-    lines.append("")
+    w("## Vector-Bootstrap\n")
+    w("\n")
     if context.vector_bootstrap:
         for entry in context.vector_bootstrap:
-            base = f"- **{entry.host}:{entry.http_port}**"
-            lines.append(base)
-            lines.append(f"  - gRPC-Port: {entry.grpc_port}")
+            # One write per entry; large collection/pipeline lists are joined.
+            parts = [f"- **{entry.host}:{entry.http_port}**", f"  - gRPC-Port: {entry.grpc_port}"]
             if entry.admin_secret:
-                lines.append(f"  - Admin-Secret: {entry.admin_secret}")
+                parts.append("  - Admin-Secret: " + entry.admin_secret)
             if entry.snapshot_path:
-                lines.append(f"  - Snapshots: {entry.snapshot_path}")
+                parts.append("  - Snapshots: " + entry.snapshot_path)
             if entry.collections:
-                lines.append("  - Kollektionen:")
-                for collection in entry.collections:
-                    lines.append(f"    - {collection.describe()}")
+                parts.append("  - Kollektionen:")
+                parts.extend(["    - " + collection.describe() for collection in entry.collections])
             if entry.pipelines:
-                lines.append("  - Pipelines:")
-                for pipeline in entry.pipelines:
-                    lines.append(f"    - {pipeline.describe()}")
+                parts.append("  - Pipelines:")
+                parts.extend(["    - " + pipeline.describe() for pipeline in entry.pipelines])
+            parts.append("")
+            w("\n".join(parts))
     else:
-        lines.append("_Keine Vector-Bootstrap-Einträge gefunden._")
-    lines.append("")
+        w("_Keine Vector-Bootstrap-Einträge gefunden._\n")
 
-    return "\n".join(lines).strip() + "\n"
 
-
-def _render_markdown_summary_list(title: str, items: Sequence[str]) -> List[str]:
+def _render_markdown_summary_list(title: str, items: Sequence[str]) -> str:
     formatted_items = ", ".join(f"`{item}`" for item in items) if items else "_Keine_"
-    return [f"- {title}: {formatted_items}"]
+    return f"- {title}: {formatted_items}\n"
+
 
+_MARKDOWN_CELL_TABLE = str.maketrans({"|": "\\|"})
 
-def _markdown_table(headers: Sequence[str], rows: Sequence[Sequence[str]]) -> List[str]:
-    escaped_headers = [header.replace("|", "\\|") for header in headers]
-    lines = ["| " + " | ".join(escaped_headers) + " |"]
-    lines.append("| " + " | ".join(["---"] * len(headers)) + " |")
+
+def _markdown_table(
+    write: Callable[[str], object], headers: Sequence[str], rows: Sequence[Sequence[str]]
+) -> None:
+    row_template = "| " + " | ".join(["{}"] * len(headers)) + " |\n"
+    table = _MARKDOWN_CELL_TABLE
+    write(row_template.format(*(header.translate(table) for header in headers)))
+    write(row_template.format(*["---"] * len(headers)))
     for row in rows:
-        escaped = [cell.replace("|", "\\|") for cell in row]
-        lines.append("| " + " | ".join(escaped) + " |")
-    return lines
+        write(row_template.format(*(cell.translate(table) for cell in row)))
 
 
 def _markdown_multiline(value: str) -> str:
     return value.replace("\n", "<br>") if value else "—"
 
 
-def _render_html(context: _DocumentationContext) -> str:
+def _render_html(context: _DocumentationContext, w: Callable[[str], object]) -> None:
     profile = context.profile
-    timestamp = html.escape(context.generated_at.isoformat())
-    origin = html.escape(_format_profile_origin(context.profile_path, profile.name))
+    timestamp = _escape(context.timestamp_html)
+    origin = _escape(context.origin)
+
+    w(
+        "<!DOCTYPE html>\n"
+        "<html lang=\"de\">\n"
+        "  <head>\n"
+        "    <meta charset=\"utf-8\">\n"
+        "    <title>Installer Report: "
+        + _escape(profile.name)
+        + "</title>\n"
+        "    <style>body{font-family:system-ui, sans-serif;line-height:1.5;padding:2rem;}"
+        "table{border-collapse:collapse;width:100%;margin-bottom:1.5rem;}"
+        "th,td{border:1px solid #ddd;padding:0.5rem;vertical-align:top;}"
+        "th{background:#f5f5f5;text-align:left;}"
+        "section{margin-bottom:2rem;}"
+        "code{background:#f2f2f2;padding:0 0.2rem;border-radius:3px;}"
+        "ul{margin-top:0.5rem;margin-bottom:0.5rem;}"
+        "</style>\n"
+        "  </head>\n"
+        "  <body>\n"
+    )
 
-    sections: List[str] = []
-    sections.append("<section>")
-    sections.append(f"  <h1>Installer Report: {html.escape(profile.name)}</h1>")
-    sections.append(f"  <p><em>Erstellt am {timestamp} – Profil: {origin}</em></p>")
+    w("<section>\n")
+    w(f"  <h1>Installer Report: {_escape(profile.name)}</h1>\n")
+    w(f"  <p><em>Erstellt am {timestamp} – Profil: {origin}</em></p>\n")
     if profile.description:
-        sections.append(f"  <p>{html.escape(profile.description)}</p>")
-    sections.append("</section>")
-
-    sections.append("<section>")
-    sections.append("  <h2>Ausführungsübersicht</h2>")
-    sections.append("  <ul>")
-    sections.append(_html_summary_item("Geplante Komponenten", context.report.planned_components))
-    sections.append(_html_summary_item("Ausgeführte Komponenten", context.report.executed_components))
-    sections.append(_html_summary_item("Übersprungene Komponenten", context.report.skipped_components))
-    sections.append("  </ul>")
-    sections.append("</section>")
-
-    sections.append("<section>")
-    sections.append("  <h2>Komponenten</h2>")
-    sections.append(_html_table(
+        w(f"  <p>{_escape(profile.description)}</p>\n")
+    w("</section>\n")
+
+    w("<section>\n")
+    w("  <h2>Ausführungsübersicht</h2>\n")
+    w("  <ul>\n")
+    w(_html_summary_item("Geplante Komponenten", context.report.planned_components))
+    w(_html_summary_item("Ausgeführte Komponenten", context.report.executed_components))
+    w(_html_summary_item("Übersprungene Komponenten", context.report.skipped_components))
+    w("  </ul>\n")
+    w("</section>\n")
+
+    w("<section>\n")
+    w("  <h2>Komponenten</h2>\n")
+    _html_table(
+        w,
         ["Name", "Beschreibung", "Aufgaben", "Abhängigkeiten", "Aktionen", "Platzierung"],
-        [
-            [
-                component.name,
-                component.description or "—",
-                _format_tasks(component.tasks),
-                _format_dependencies(component.depends_on),
-                _format_actions(component.actions),
-                _describe_placement(component.placement),
-            ]
-            for component in context.plan
-        ],
-    ))
-    sections.append("</section>")
+        context.component_rows,
+    )
+    w("</section>\n")
 
-    sections.append("<section>")
-    sections.append("  <h2>Knoten &amp; Ressourcen</h2>")
+    w("<section>\n")
+    w("  <h2>Knoten &amp; Ressourcen</h2>\n")
     if context.nodes:
-        sections.append(
-            _html_table(
-                ["Name", "Rolle", "Labels", "Kapazität"],
-                [
-                    [
-                        node.name,
-                        node.role or "—",
-                        _format_mapping(node.labels) or "—",
-                        _describe_resources(node.capacity),
-                    ]
-                    for node in context.nodes
-                ],
-            )
+        _html_table(
+            w,
+            ["Name", "Rolle", "Labels", "Kapazität"],
+            context.node_rows,
         )
     else:
-        sections.append("  <p><em>Keine dedizierten Knoten im Profil hinterlegt.</em></p>")
-    sections.append("</section>")
+        w("  <p><em>Keine dedizierten Knoten im Profil hinterlegt.</em></p>\n")
+    w("</section>\n")
 
-    sections.append("<section>")
-    sections.append("  <h2>Workflow-Vorlagen</h2>")
+    w("<section>\n")
+    w("  <h2>Workflow-Vorlagen</h2>\n")
     if context.workflows:
-        sections.append(
-            _html_table(
-                ["Name", "Loop", "Runtime", "Beschreibung", "Inputs", "Outputs", "Phasen"],
-                [
-                    [
-                        workflow.name,
-                        workflow.loop,
-                        workflow.runtime,
-                        workflow.description or "—",
-                        _format_list(workflow.inputs),
-                        _format_list(workflow.outputs),
-                        _format_list(workflow.phases),
-                    ]
-                    for workflow in context.workflows
-                ],
-            )
+        _html_table(
+            w,
+            ["Name", "Loop", "Runtime", "Beschreibung", "Inputs", "Outputs", "Phasen"],
+            context.workflow_rows,
         )
     else:
-        sections.append("  <p><em>Keine Workflow-Vorlagen definiert.</em></p>")
-    sections.append("</section>")
+        w("  <p><em>Keine Workflow-Vorlagen definiert.</em></p>\n")
+    w("</section>\n")
 
-    sections.append("<section>")
-    sections.append("  <h2>Loop-Trigger</h2>")
+    w("<section>\n")
+    w("  <h2>Loop-Trigger</h2>\n")
     if context.schedules:
-        sections.append("  <ul>")
+        w("  <ul>\n")
         for schedule in context.schedules:
             description = schedule.description or "ohne Beschreibung"
-            sections.append(
-                f"    <li><strong>{html.escape(schedule.loop)}</strong> ({html.escape(description)})"
+            w(
+                f"    <li><strong>{_escape(schedule.loop)}</strong>"
+                f" ({_escape(description)})\n"
             )
             if schedule.triggers:
-                sections.append("      <ul>")
+                w("      <ul>\n")
                 for trigger in schedule.triggers:
-                    sections.append(f"        <li>{html.escape(trigger)}</li>")
-                sections.append("      </ul>")
-            sections.append("    </li>")
-        sections.append("  </ul>")
+                    w(f"        <li>{_escape(trigger)}</li>\n")
+                w("      </ul>\n")
+            w("    </li>\n")
+        w("  </ul>\n")
     else:
-        sections.append("  <p><em>Keine Scheduler-Informationen vorhanden.</em></p>")
-    sections.append("</section>")
+        w("  <p><em>Keine Scheduler-Informationen vorhanden.</em></p>\n")
+    w("</section>\n")
 
-    sections.append("<section>")
-    sections.append("  <h2>Retention Policies</h2>")
+    w("<section>\n")
+    w("  <h2>Retention Policies</h2>\n")
     if context.retention:
-        sections.append(
-            _html_table(
-                ["Komponente", "Feld", "Wert", "Provider"],
-                [
-                    [entry.component, entry.subject, entry.value, entry.provider or "—"]
-                    for entry in context.retention
-                ],
-            )
+        _html_table(
+            w,
+            ["Komponente", "Feld", "Wert", "Provider"],
+            context.retention_rows,
         )
     else:
-        sections.append("  <p><em>Keine Retention-Parameter entdeckt.</em></p>")
-    sections.append("</section>")
+        w("  <p><em>Keine Retention-Parameter entdeckt.</em></p>\n")
+    w("</section>\n")
 
-    sections.append("<section>")
-    sections.append("  <h2>Vector-Bootstrap</h2>")
+    w("<section>\n")
+    w("  <h2>Vector-Bootstrap</h2>\n")
     if context.vector_bootstrap:
-        sections.append("  <ul>")
+        w("  <ul>\n")
+        escape = _escape
         for entry in context.vector_bootstrap:
-            sections.append(
-                f"    <li><strong>{html.escape(entry.host)}:{entry.http_port}</strong>"
-            )
-            sections.append("      <ul>")
-            sections.append(f"        <li>gRPC-Port: {entry.grpc_port}</li>")
+            parts = [
+                f"    <li><strong>{escape(entry.host)}:{entry.http_port}</strong>",
+                "      <ul>",
+                f"        <li>gRPC-Port: {entry.grpc_port}</li>",
+            ]
             if entry.admin_secret:
-                sections.append(
-                    f"        <li>Admin-Secret: {html.escape(entry.admin_secret)}</li>"
-                )
+                parts.append(f"        <li>Admin-Secret: {escape(entry.admin_secret)}</li>")
             if entry.snapshot_path:
-                sections.append(
-                    f"        <li>Snapshots: {html.escape(entry.snapshot_path)}</li>"
-                )
+                parts.append(f"        <li>Snapshots: {escape(entry.snapshot_path)}</li>")
             if entry.collections:
-                sections.append("        <li>Kollektionen:<ul>")
-                for collection in entry.collections:
-                    sections.append(
-                        f"          <li>{html.escape(collection.describe())}</li>"
-                    )
-                sections.append("        </ul></li>")
+                parts.append("        <li>Kollektionen:<ul>")
+                parts.extend(
+                    [
+                        "          <li>" + escape(collection.describe()) + "</li>"
+                        for collection in entry.collections
+                    ]
+                )
+                parts.append("        </ul></li>")
             if entry.pipelines:
-                sections.append("        <li>Pipelines:<ul>")
-                for pipeline in entry.pipelines:
-                    sections.append(
-                        f"          <li>{html.escape(pipeline.describe())}</li>"
-                    )
-                sections.append("        </ul></li>")
-            sections.append("      </ul>")
-            sections.append("    </li>")
-        sections.append("  </ul>")
+                parts.append("        <li>Pipelines:<ul>")
+                parts.extend(
+                    [
+                        "          <li>" + escape(pipeline.describe()) + "</li>"
+                        for pipeline in entry.pipelines
+                    ]
+                )
+                parts.append("        </ul></li>")
+            parts.append("      </ul>\n    </li>\n")
+            w("\n".join(parts))
+        w("  </ul>\n")
     else:
-        sections.append("  <p><em>Keine Vector-Bootstrap-Einträge gefunden.</em></p>")
-    sections.append("</section>")
+        w("  <p><em>Keine Vector-Bootstrap-Einträge gefunden.</em></p>\n")
+    w("</section>\n")
 
-    body = "\n".join(sections)
-    return (
-        "<!DOCTYPE html>\n"
-        "<html lang=\"de\">\n"
-        "  <head>\n"
-        "    <meta charset=\"utf-8\">\n"
-        "    <title>Installer Report: "
-        + html.escape(profile.name)
-        + "</title>\n"
-        "    <style>body{font-family:system-ui, sans-serif;line-height:1.5;padding:2rem;}"
-        "table{border-collapse:collapse;width:100%;margin-bottom:1.5rem;}"
-        "th,td{border:1px solid #ddd;padding:0.5rem;vertical-align:top;}"
-        "th{background:#f5f5f5;text-align:left;}"
-        "section{margin-bottom:2rem;}"
-        "code{background:#f2f2f2;padding:0 0.2rem;border-radius:3px;}"
-        "ul{margin-top:0.5rem;margin-bottom:0.5rem;}"
-        "</style>\n"
-        "  </head>\n"
-        "  <body>\n"
-        f"{body}\n"
-        "  </body>\n"
-        "</html>\n"
-    )
+    w("  </body>\n</html>\n")
 
 
 def _format_profile_origin(path: pathlib.Path | None, fallback: str) -> str:
@@ -460,15 +549,10 @@ def _format_dependencies(dependencies: Sequence[str]) -> str:
     return "\n".join(f"• {dependency}" for dependency in dependencies)
 
 
-def _format_actions(actions: Sequence[object]) -> str:
+def _format_actions(actions: Sequence[Action]) -> str:
     if not actions:
         return "—"
-    formatted: List[str] = []
-    for action in actions:
-        provider = getattr(action, "provider", "")
-        operation = getattr(action, "operation", "")
-        formatted.append(f"• {provider}:{operation}")
-    return "\n".join(formatted)
+    return "\n".join([f"• {action.provider}:{action.operation}" for action in actions])
 
 
 def _describe_placement(placement: PlacementPolicy | None) -> str:
@@ -497,22 +581,24 @@ def _describe_placement(placement: PlacementPolicy | None) -> str:
     return "\n".join(f"• {part}" for part in parts) if parts else "—"
 
 
-def _describe_resources(profile: object) -> str:
-    if not hasattr(profile, "as_dict"):
+class _HasAsDict(Protocol):
+    def as_dict(self) -> Mapping[str, object]: ...
+
+
+def _describe_resources(profile: _HasAsDict) -> str:
+    # Only the attribute lookup is guarded; errors raised inside as_dict() propagate.
+    try:
+        as_dict = profile.as_dict
+    except AttributeError:
         return "—"
-    values = getattr(profile, "as_dict")()
-    items = [f"{key}={value}" for key, value in values.items() if value]
+    else:
+        items = [f"{key}={value}" for key, value in as_dict().items() if value]
     return ", ".join(items) if items else "—"
 
 
-def _format_mapping(mapping: Iterable[tuple[str, str]] | dict[str, str]) -> str:
-    if not mapping:
-        return ""
-    if isinstance(mapping, dict):
-        items = mapping.items()
-    else:
-        items = mapping
-    return "\n".join(f"{key}={value}" for key, value in items)
+def _format_mapping(mapping: Mapping[str, str]) -> str:
+    # Labels are validated into mappings by the config loader; empty ones join to "".
+    return "\n".join([f"{key}={value}" for key, value in mapping.items()])
 
 
 def _format_list(values: Sequence[str]) -> str:
@@ -523,36 +609,38 @@ def _format_list(values: Sequence[str]) -> str:
 
 def _html_summary_item(title: str, items: Sequence[str]) -> str:
     if items:
-        content = ", ".join(f"<code>{html.escape(item)}</code>" for item in items)
+        content = ", ".join(f"<code>{_escape(item)}</code>" for item in items)
     else:
         content = "<em>Keine</em>"
-    return f"    <li>{html.escape(title)}: {content}</li>"
+    return f"    <li>{_escape(title)}: {content}</li>\n"
 
 
-def _html_table(headers: Sequence[str], rows: Sequence[Sequence[str]]) -> str:
-    header_html = "".join(f"<th>{html.escape(header)}</th>" for header in headers)
-    body_rows: List[str] = []
-    for row in rows:
-        cells = "".join(f"<td>{_html_cell(cell)}</td>" for cell in row)
-        body_rows.append(f"<tr>{cells}</tr>")
-    if not body_rows:
-        body_rows.append(
-            f"<tr><td colspan=\"{len(headers)}\"><em>Keine Einträge</em></td></tr>"
+def _html_table(
+    write: Callable[[str], object], headers: Sequence[str], rows: Sequence[Sequence[str]]
+) -> None:
+    header_html = "".join(f"<th>{_escape(header)}</th>" for header in headers)
+    if rows:
+        body = "".join(
+            "<tr>" + "".join(f"<td>{_html_cell(cell)}</td>" for cell in row) + "</tr>"
+            for row in rows
         )
-    table_lines = [
-        "  <table>",
-        f"    <thead><tr>{header_html}</tr></thead>",
-        "    <tbody>" + "".join(body_rows) + "</tbody>",
-        "  </table>",
-    ]
-    return "\n".join(table_lines)
+    else:
+        body = f"<tr><td colspan=\"{len(headers)}\"><em>Keine Einträge</em></td></tr>"
+    write(
+        "  <table>\n"
+        f"    <thead><tr>{header_html}</tr></thead>\n"
+        f"    <tbody>{body}</tbody>\n"
+        "  </table>\n"
+    )
+
+
+# html.escape(quote=True) plus line breaks, applied in a single pass.
+_HTML_CELL_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;", "\n": "<br>"}
+)
 
 
 def _html_cell(value: str) -> str:
     if not value or value == "—":
         return "<em>—</em>"
-    escaped = html.escape(value)
-    escaped = escaped.replace("\n", "<br>")
-    escaped = escaped.replace("• ", "")
-    return escaped
-
+    return value.translate(_HTML_CELL_TABLE).replace("• ", "")
@@ -3,7 +3,20 @@
 from __future__ import annotations
 
 import dataclasses
-from typing import Iterable, List, Mapping, MutableMapping, Sequence
+import json
+import sys
+from functools import lru_cache
+from typing import Hashable, Iterable, Iterator, List, Mapping, Sequence
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+
+_INTERN_MAX_LENGTH = 64
+# Default for required-field lookups, distinguishing "absent" from ``None``.
+_MISSING: object = object()
 
 
 @dataclasses.dataclass(slots=True)
@@ -15,25 +28,36 @@ class VectorCollectionSpec:
     distance: str
     metadata: Mapping[str, str]
     on_disk: bool = False
+    _description: str = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Specs are not modified after parsing; render the description once.
+        metadata = ",".join([f"{key}:{value}" for key, value in self.metadata.items()])
+        storage = "on-disk" if self.on_disk else "in-memory"
+        self._description = (
+            f"collection={self.name} dims={self.dimensions} distance={self.distance} "
+            f"storage={storage} metadata=[{metadata}]"
+        )
 
     def as_dict(self) -> Mapping[str, object]:
-        payload: MutableMapping[str, object] = {
+        # Each branch is a single dict display; no key is inserted afterwards.
+        if self.on_disk:
+            return {
+                "name": self.name,
+                "dimensions": self.dimensions,
+                "distance": self.distance,
+                "metadata": dict(self.metadata),
+                "on_disk": self.on_disk,
+            }
+        return {
             "name": self.name,
             "dimensions": self.dimensions,
             "distance": self.distance,
             "metadata": dict(self.metadata),
         }
-        if self.on_disk:
-            payload["on_disk"] = self.on_disk
-        return payload
 
     def describe(self) -> str:
-        metadata = ",".join(f"{key}:{value}" for key, value in self.metadata.items())
-        storage = "on-disk" if self.on_disk else "in-memory"
-        return (
-            f"collection={self.name} dims={self.dimensions} distance={self.distance} "
-            f"storage={storage} metadata=[{metadata}]"
-        )
+        return self._description
 
 
 @dataclasses.dataclass(slots=True)
@@ -44,22 +68,28 @@ class VectorPipelineSpec:
     source: str
     target_collection: str
     description: str | None = None
+    _description: str = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        base = f"pipeline={self.name} source={self.source} target={self.target_collection}"
+        self._description = f"{base} description={self.description}" if self.description else base
 
     def as_dict(self) -> Mapping[str, object]:
-        payload: MutableMapping[str, object] = {
+        if self.description:
+            return {
+                "name": self.name,
+                "source": self.source,
+                "target_collection": self.target_collection,
+                "description": self.description,
+            }
+        return {
             "name": self.name,
             "source": self.source,
             "target_collection": self.target_collection,
         }
-        if self.description:
-            payload["description"] = self.description
-        return payload
 
     def describe(self) -> str:
-        base = f"pipeline={self.name} source={self.source} target={self.target_collection}"
-        if self.description:
-            base += f" description={self.description}"
-        return base
+        return self._description
 
 
 @dataclasses.dataclass(slots=True)
@@ -73,14 +103,38 @@ class VectorBootstrapSummary:
     snapshot_path: str | None
     collections: List[VectorCollectionSpec]
     pipelines: List[VectorPipelineSpec]
+    _description: str = dataclasses.field(init=False, repr=False, compare=False)
+    _payload: dict[str, object] | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._description = " ".join(self._description_parts())
+
+    def _description_parts(self) -> Iterator[str]:
+        # Built from the already rendered collection and pipeline descriptions.
+        yield f"vector-db={self.host}:{self.http_port}"
+        if self.admin_secret:
+            yield f"admin_secret={self.admin_secret}"
+        if self.snapshot_path:
+            yield f"snapshots={self.snapshot_path}"
+        yield from map(VectorCollectionSpec.describe, self.collections)
+        yield from map(VectorPipelineSpec.describe, self.pipelines)
 
     def as_dict(self) -> Mapping[str, object]:
-        payload: MutableMapping[str, object] = {
+        # Summaries are not modified after construction, so the serialised
+        # children are built once; callers get a shallow copy.
+        if self._payload is None:
+            self._payload = self._build_payload()
+        return dict(self._payload)
+
+    def _build_payload(self) -> dict[str, object]:
+        payload: dict[str, object] = {
             "host": self.host,
             "http_port": self.http_port,
             "grpc_port": self.grpc_port,
-            "collections": [collection.as_dict() for collection in self.collections],
-            "pipelines": [pipeline.as_dict() for pipeline in self.pipelines],
+            "collections": list(map(VectorCollectionSpec.as_dict, self.collections)),
+            "pipelines": list(map(VectorPipelineSpec.as_dict, self.pipelines)),
         }
         if self.admin_secret:
             payload["admin_secret"] = self.admin_secret
@@ -89,17 +143,10 @@ class VectorBootstrapSummary:
         return payload
 
     def describe(self) -> str:
-        parts = [f"vector-db={self.host}:{self.http_port}"]
-        if self.admin_secret:
-            parts.append(f"admin_secret={self.admin_secret}")
-        if self.snapshot_path:
-            parts.append(f"snapshots={self.snapshot_path}")
-        parts.extend(collection.describe() for collection in self.collections)
-        parts.extend(pipeline.describe() for pipeline in self.pipelines)
-        return " ".join(parts)
+        return self._description
 
 
-@dataclasses.dataclass(slots=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class LearningPathway:
     """Describe how learning assets are shared across agents."""
 
@@ -130,64 +177,151 @@ class ExplainabilityReport:
         return {
             "profile": self.profile,
             "description": self.description,
-            "vector_bootstrap": [entry.as_dict() for entry in self.vector_bootstrap],
-            "learning_paths": [path.as_dict() for path in self.learning_paths],
+            # Children are serialised through their unbound as_dict in C-level map
+            # loops rather than per-item attribute lookups.
+            "vector_bootstrap": list(map(VectorBootstrapSummary.as_dict, self.vector_bootstrap)),
+            "learning_paths": list(map(LearningPathway.as_dict, self.learning_paths)),
         }
 
+    def to_json(self) -> bytes:
+        """Return ``as_dict()`` as compact UTF-8 JSON.
+
+        The optional fields are omitted when empty, which native dataclass
+        serialisation would not do, so the dict is still built first.
+        """
+
+        payload = self.as_dict()
+        if orjson is not None:
+            return orjson.dumps(payload)
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class _DefinitionsKey:
+    """Hashable fingerprint of raw definitions that keeps the originals for parsing."""
+
+    __slots__ = ("definitions", "_key", "_hash")
+
+    def __init__(self, definitions: List[Mapping[str, object]], key: tuple) -> None:
+        self.definitions = definitions
+        self._key = key
+        self._hash = hash(key)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _DefinitionsKey) and self._key == other._key
+
+
+def _freeze(value: object) -> Hashable:
+    # Insertion order is kept (it decides metadata order) and leaves carry their
+    # type, so e.g. ``1`` and ``True`` (which hash alike) stringify differently.
+    if isinstance(value, Mapping):
+        return (dict, tuple([(_freeze(key), _freeze(item)) for key, item in value.items()]))
+    if isinstance(value, (list, tuple)):
+        return (list, tuple([_freeze(item) for item in value]))
+    hash(value)
+    return (type(value), value)
+
+
+def _definitions_key(entries: List[Mapping[str, object]]) -> _DefinitionsKey | None:
+    try:
+        key = tuple([_freeze(entry) for entry in entries])
+    except TypeError:  # unhashable leaf values are parsed without caching
+        return None
+    return _DefinitionsKey(entries, key)
+
 
 def parse_collections(definitions: Iterable[Mapping[str, object]]) -> List[VectorCollectionSpec]:
-    """Convert raw profile definitions into collection specs."""
+    """Convert raw profile definitions into collection specs.
+
+    Results are memoised by the content of ``definitions``; the returned specs
+    may be shared between calls and must be treated as read-only.
+    """
+
+    entries = list(definitions)
+    key = _definitions_key(entries)
+    if key is None:
+        return list(_parse_collections(entries))
+    return list(_parse_collections_cached(key))
+
 
+@lru_cache(maxsize=128)
+def _parse_collections_cached(key: _DefinitionsKey) -> tuple[VectorCollectionSpec, ...]:
+    return _parse_collections(key.definitions)
+
+
+def _parse_collections(
+    definitions: Iterable[Mapping[str, object]],
+) -> tuple[VectorCollectionSpec, ...]:
     collections: List[VectorCollectionSpec] = []
+    append = collections.append
     for definition in definitions:
-        name = str(definition.get("name"))
+        # One bound ``get`` per definition; fields are coerced straight into the spec.
+        get = definition.get
+        name = _intern(str(get("name")))
         if not name:
             raise RuntimeError("Vector collection requires a 'name'")
-        try:
-            dimensions_raw = definition["dimensions"]
-        except KeyError as exc:  # pragma: no cover - defensive
-            raise RuntimeError(f"Vector collection '{name}' is missing 'dimensions'") from exc
-        dimensions = int(dimensions_raw)
-        distance = str(definition.get("distance", "cosine"))
-        on_disk = bool(definition.get("on_disk", False))
-        metadata = _normalise_metadata(definition.get("metadata"))
-        collections.append(
+        dimensions_raw = get("dimensions", _MISSING)
+        if dimensions_raw is _MISSING:  # pragma: no cover - defensive
+            raise RuntimeError(f"Vector collection '{name}' is missing 'dimensions'")
+        append(
             VectorCollectionSpec(
-                name=name,
-                dimensions=dimensions,
-                distance=distance,
-                metadata=metadata,
-                on_disk=on_disk,
+                name,
+                int(dimensions_raw),
+                _intern(str(get("distance", "cosine"))),
+                _normalise_metadata(get("metadata")),
+                bool(get("on_disk", False)),
             )
         )
-    return collections
+    return tuple(collections)
 
 
 def parse_pipelines(definitions: Iterable[Mapping[str, object]]) -> List[VectorPipelineSpec]:
-    """Convert raw pipeline definitions into pipeline specs."""
+    """Convert raw pipeline definitions into pipeline specs.
+
+    Memoised like :func:`parse_collections`; treat the returned specs as read-only.
+    """
+
+    entries = list(definitions)
+    key = _definitions_key(entries)
+    if key is None:
+        return list(_parse_pipelines(entries))
+    return list(_parse_pipelines_cached(key))
 
+
+@lru_cache(maxsize=128)
+def _parse_pipelines_cached(key: _DefinitionsKey) -> tuple[VectorPipelineSpec, ...]:
+    return _parse_pipelines(key.definitions)
+
+
+def _parse_pipelines(
+    definitions: Iterable[Mapping[str, object]],
+) -> tuple[VectorPipelineSpec, ...]:
     pipelines: List[VectorPipelineSpec] = []
+    append = pipelines.append
     for definition in definitions:
-        name = str(definition.get("name"))
+        get = definition.get
+        name = _intern(str(get("name")))
         if not name:
             raise RuntimeError("Vector pipeline requires a 'name'")
-        target_collection = str(definition.get("target_collection"))
+        target_collection = str(get("target_collection"))
         if not target_collection:
             raise RuntimeError(
                 f"Vector pipeline '{name}' is missing 'target_collection'"
             )
-        source = str(definition.get("source", ""))
-        description_raw = definition.get("description")
-        description = str(description_raw) if description_raw not in (None, "") else None
-        pipelines.append(
+        description_raw = get("description")
+        append(
             VectorPipelineSpec(
-                name=name,
-                source=source,
-                target_collection=target_collection,
-                description=description,
+                name,
+                _intern(str(get("source", ""))),
+                target_collection,
+                None
+                if description_raw is None or description_raw == ""
+                else str(description_raw),
             )
         )
-    return pipelines
+    return tuple(pipelines)
 
 
 def build_bootstrap_summary(
@@ -215,41 +349,47 @@ def build_bootstrap_summary(
     )
 
 
-def build_learning_paths() -> List[LearningPathway]:
-    """Return default learning pathways between agents for documentation."""
-
-    return [
-        LearningPathway(
-            title="Incident → Knowledge Consolidation",
-            source="A_MON (Prometheus/Loki Findings)",
-            target="A_CODE · Vector-DB",
-            artefacts=[
-                "Anomalie-Beschreibungen",
-                "Remediation-Playbooks",
-                "Lessons Learned Markdown",
-            ],
+_DEFAULT_LEARNING_PATHS: tuple[LearningPathway, ...] = (
+    LearningPathway(
+        title="Incident → Knowledge Consolidation",
+        source="A_MON (Prometheus/Loki Findings)",
+        target="A_CODE · Vector-DB",
+        artefacts=(
+            "Anomalie-Beschreibungen",
+            "Remediation-Playbooks",
+            "Lessons Learned Markdown",
         ),
-        LearningPathway(
-            title="Deployment → Explainability",
-            source="A_INFRA (OpenTofu/Ansible)",
-            target="A_CODE · Ralf-Core",
-            artefacts=[
-                "Änderungs-Summary",
-                "Impact-Analyse",
-                "Verknüpfte Dashboards",
-            ],
+    ),
+    LearningPathway(
+        title="Deployment → Explainability",
+        source="A_INFRA (OpenTofu/Ansible)",
+        target="A_CODE · Ralf-Core",
+        artefacts=(
+            "Änderungs-Summary",
+            "Impact-Analyse",
+            "Verknüpfte Dashboards",
         ),
-        LearningPathway(
-            title="Planner Feedback Loop",
-            source="A_PLAN · Foreman Discovery",
-            target="Vector-DB · Forecast Pipelines",
-            artefacts=[
-                "Ressourcen-Simulationen",
-                "Kapazitäts-Trends",
-                "Empfohlene Platzierungspläne",
-            ],
+    ),
+    LearningPathway(
+        title="Planner Feedback Loop",
+        source="A_PLAN · Foreman Discovery",
+        target="Vector-DB · Forecast Pipelines",
+        artefacts=(
+            "Ressourcen-Simulationen",
+            "Kapazitäts-Trends",
+            "Empfohlene Platzierungspläne",
         ),
-    ]
+    ),
+)
+
+
+def build_learning_paths() -> List[LearningPathway]:
+    """Return default learning pathways between agents for documentation.
+
+    The pathways are static and shared between calls (they are frozen).
+    """
+
+    return list(_DEFAULT_LEARNING_PATHS)
 
 
 def render_report(
@@ -268,19 +408,29 @@ def render_report(
     )
 
 
+def _intern(text: str) -> str:
+    # Tag keys/values and names repeat across collections; long free text is
+    # left alone so it is not pinned in the interpreter's intern table.
+    return sys.intern(text) if len(text) <= _INTERN_MAX_LENGTH else text
+
+
 def _normalise_metadata(raw: object) -> Mapping[str, str]:
-    if raw in (None, ""):
-        return {}
-    if not isinstance(raw, Iterable) or isinstance(raw, (str, bytes)):
-        raise RuntimeError("Vector collection metadata must be an iterable of mappings")
-
-    metadata: dict[str, str] = {}
-    for entry in raw:
-        if not isinstance(entry, Mapping):
-            raise RuntimeError("Vector collection metadata must be mappings")
-        for key, value in entry.items():
-            metadata[str(key)] = str(value)
-    return metadata
+    # YAML hands over plain lists; check that first and skip the generic tests.
+    if type(raw) is not list:
+        if raw is None or raw == "":
+            return {}
+        if not isinstance(raw, Iterable) or isinstance(raw, (str, bytes)):
+            raise RuntimeError("Vector collection metadata must be an iterable of mappings")
+
+    entries = raw if type(raw) is list else list(raw)
+    if not all(isinstance(entry, Mapping) for entry in entries):
+        raise RuntimeError("Vector collection metadata must be mappings")
+    # Later entries override earlier ones, as with successive dict updates.
+    return {
+        _intern(str(key)): _intern(str(value))
+        for entry in entries
+        for key, value in entry.items()
+    }
 
 
 __all__ = [
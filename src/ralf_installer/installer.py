@@ -11,9 +11,14 @@ import urllib.error
 import urllib.request
 from typing import Iterable, List, Mapping, Sequence
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
 from . import explainability, n8n, planner
 from .config import Action, Component, Profile
-from .providers import execute_action
+from .providers import OperationHandler, resolve_action
 
 
 @dataclasses.dataclass(slots=True)
@@ -31,6 +36,14 @@ class ExecutionReport:
             "skipped_components": self.skipped_components,
         }
 
+    def to_json(self) -> bytes:
+        """Return the report as compact UTF-8 JSON with the ``as_dict()`` layout."""
+
+        if orjson is not None:
+            # orjson walks the slots dataclass itself, in field (= as_dict) order.
+            return orjson.dumps(self)
+        return _dumps_compact(self.as_dict())
+
 
 @dataclasses.dataclass(slots=True)
 class LoopScheduleSummary:
@@ -98,6 +111,7 @@ class Installer:
     def __init__(self, profile: Profile, *, dry_run: bool = False) -> None:
         self._profile = profile
         self._dry_run = dry_run
+        self._plan: tuple[Component, ...] | None = None
 
     @property
     def profile(self) -> Profile:
@@ -108,8 +122,14 @@ class Installer:
         return self._dry_run
 
     def plan(self) -> List[Component]:
-        """Return components in the order they will be processed."""
-        return self._profile.resolve_dependencies()
+        """Return components in the order they will be processed.
+
+        The dependency order is resolved once per installer; callers receive a
+        fresh list each time.
+        """
+        if self._plan is None:
+            self._plan = tuple(self._profile.resolve_dependencies())
+        return list(self._plan)
 
     def describe_loop_schedules(self) -> List[LoopScheduleSummary]:
         """Return declarative information about configured loop schedules."""
@@ -264,6 +284,8 @@ class Installer:
             raise RuntimeError(
                 "Unable to satisfy placement requirements for components: %s" % missing
             )
+        # Unknown providers/operations fail here, before any action has run.
+        resolved = _resolve_component_actions(ordered_components)
 
         for decision in distribution_plan.decisions:
             if not decision.required:
@@ -279,36 +301,60 @@ class Installer:
                     f"[{prefix}] placement {decision.component}: no suitable node available"
                 )
 
-        executed: List[str] = []
-        skipped: List[str] = []
-
-        for component in ordered_components:
-            _run_component(component, dry_run=self._dry_run)
-            if self._dry_run:
-                skipped.append(component.name)
-            else:
-                executed.append(component.name)
+        for component, actions in resolved:
+            _run_component(component, actions, dry_run=self._dry_run)
 
         bootstrap_plan = self.describe_vector_bootstrap()
         if bootstrap_plan:
             _initialise_vector_bootstrap(bootstrap_plan, dry_run=self._dry_run)
 
+        # A failing component raises, so every planned component ends up either
+        # executed or (in dry-run mode) skipped; copy the name list once at the end.
+        planned = [component.name for component in ordered_components]
         return ExecutionReport(
-            planned_components=[component.name for component in ordered_components],
-            executed_components=executed,
-            skipped_components=skipped,
+            planned_components=planned,
+            executed_components=[] if self._dry_run else planned[:],
+            skipped_components=planned[:] if self._dry_run else [],
+        )
+
+
+def _resolve_component_actions(
+    components: Sequence[Component],
+) -> List[tuple[Component, List[tuple[Action, OperationHandler]]]]:
+    """Look up the handler of every action once, ahead of execution."""
+
+    return [
+        (
+            component,
+            [
+                (
+                    action,
+                    _resolve_vaultwarden_action(action)
+                    if action.provider == "vaultwarden"
+                    else resolve_action(action),
+                )
+                for action in component.actions
+            ],
         )
+        for component in components
+    ]
 
 
-def _run_component(component: Component, *, dry_run: bool) -> None:
-    """Execute all actions for a component."""
+def _dumps_compact(payload: object) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
-    if component.actions:
-        for action in component.actions:
-            if action.provider == "vaultwarden":
-                _execute_vaultwarden_action(action, dry_run=dry_run)
-            else:
-                execute_action(action, dry_run=dry_run)
+
+def _run_component(
+    component: Component,
+    actions: Sequence[tuple[Action, OperationHandler]],
+    *,
+    dry_run: bool,
+) -> None:
+    """Execute all (pre-resolved) actions for a component."""
+
+    if actions:
+        for action, handler in actions:
+            handler(action.options, dry_run=dry_run)
     else:
         for task in component.tasks:
             _log_task(component.name, task, dry_run=dry_run)
@@ -454,16 +500,14 @@ def _initialise_vector_bootstrap(
         print(f"[{prefix}] vector-db:bootstrap {summary.describe()}")
 
 
-def _execute_vaultwarden_action(action: Action, *, dry_run: bool) -> None:
-    """Handle vaultwarden specific operations defined in profiles."""
+def _resolve_vaultwarden_action(action: Action) -> OperationHandler:
+    """Return the handler for vaultwarden specific operations defined in profiles."""
 
     operation = action.operation
-    options = dict(action.options)
 
     if operation == "rotate_secrets":
-        _rotate_vaultwarden_secrets(options, dry_run=dry_run)
-    else:  # pragma: no cover - defensive
-        raise RuntimeError(f"Unsupported vaultwarden operation '{operation}'")
+        return _rotate_vaultwarden_secrets
+    raise RuntimeError(f"Unsupported vaultwarden operation '{operation}'")
 
 
 def _rotate_vaultwarden_secrets(options: Mapping[str, object], *, dry_run: bool) -> None:
@@ -6,27 +6,35 @@ from typing import Callable, Dict
 
 from ..config import Action
 from . import proxmox, services
+from ._types import OperationHandler
 
 
-Handler = Callable[[str, dict[str, object], bool], None]
-
-_PROVIDERS: Dict[str, Handler] = {
-    "proxmox": proxmox.execute,
-    "service": services.execute,
+_RESOLVERS: Dict[str, Callable[[str], OperationHandler]] = {
+    "proxmox": proxmox.resolve,
+    "service": services.resolve,
 }
 
 
-def execute_action(action: Action, *, dry_run: bool) -> None:
-    """Dispatch an action to the responsible provider handler."""
+def resolve_action(action: Action) -> OperationHandler:
+    """Return the handler for ``action``; raises for unknown providers or operations.
+
+    The installer resolves every action of a plan before running any of them.
+    Handlers are called as ``handler(action.options, dry_run=...)``.
+    """
 
     try:
-        handler = _PROVIDERS[action.provider]
-    except KeyError as exc:  # pragma: no cover - defensive
+        resolve = _RESOLVERS[action.provider]
+    except KeyError as exc:
         raise RuntimeError(
             f"Unknown provider '{action.provider}' for component action '{action.operation}'"
         ) from exc
+    return resolve(action.operation)
+
+
+def execute_action(action: Action, *, dry_run: bool) -> None:
+    """Dispatch an action to the responsible provider handler."""
 
-    handler(action.operation, dict(action.options), dry_run)
+    resolve_action(action)(action.options, dry_run=dry_run)
 
 
-__all__ = ["execute_action"]
+__all__ = ["OperationHandler", "execute_action", "resolve_action"]
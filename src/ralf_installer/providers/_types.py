@@ -0,0 +1,10 @@
+"""Types shared by the provider modules."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+# Operation handlers take ``(options, *, dry_run)``.
+OperationHandler = Callable[..., None]
+
+__all__ = ["OperationHandler"]
@@ -4,24 +4,23 @@ from __future__ import annotations
 
 from typing import Iterable, Mapping
 
+from ._types import OperationHandler
 
-def execute(operation: str, options: dict[str, object], dry_run: bool) -> None:
+
+def execute(operation: str, options: Mapping[str, object], dry_run: bool) -> None:
     """Execute a proxmox operation."""
 
-    operations = {
-        "create_lxc": _create_lxc,
-        "create_vm": _create_vm,
-        "configure_network": _configure_network,
-        "run_commands": _run_commands,
-    }
+    resolve(operation)(options, dry_run=dry_run)
+
+
+def resolve(operation: str) -> OperationHandler:
+    """Return the handler for ``operation`` so callers can validate plans up front."""
 
     try:
-        handler = operations[operation]
-    except KeyError as exc:  # pragma: no cover - defensive
+        return _OPERATIONS[operation]
+    except KeyError as exc:
         raise RuntimeError(f"Unsupported proxmox operation '{operation}'") from exc
 
-    handler(options, dry_run=dry_run)
-
 
 def _create_lxc(options: Mapping[str, object], *, dry_run: bool) -> None:
     vmid = _require(options, "vmid")
@@ -105,3 +104,12 @@ def _require(options: Mapping[str, object], key: str) -> object:
 def _emit(dry_run: bool, provider: str, operation: str, description: str) -> None:
     prefix = "DRY-RUN" if dry_run else "EXEC"
     print(f"[{prefix}] {provider}:{operation} {description}")
+
+
+# Built once at import; handlers are module-level functions defined above.
+_OPERATIONS: dict[str, OperationHandler] = {
+    "create_lxc": _create_lxc,
+    "create_vm": _create_vm,
+    "configure_network": _configure_network,
+    "run_commands": _run_commands,
+}
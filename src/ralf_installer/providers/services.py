@@ -5,29 +5,21 @@ from __future__ import annotations
 from typing import Iterable, Mapping, Sequence
 
 from .. import explainability
+from ._types import OperationHandler
 
 
-def execute(operation: str, options: dict[str, object], dry_run: bool) -> None:
-    operations = {
-        "configure_postgresql": _configure_postgresql,
-        "configure_gitea": _configure_gitea,
-        "configure_vaultwarden": _configure_vaultwarden,
-        "configure_prometheus": _configure_prometheus,
-        "configure_loki": _configure_loki,
-        "configure_grafana": _configure_grafana,
-        "configure_vector_db": _configure_vector_db,
-        "bootstrap_vector_collections": _bootstrap_vector_collections,
-        "register_vector_pipelines": _register_vector_pipelines,
-        "register_prometheus_targets": _register_prometheus_targets,
-    }
+def execute(operation: str, options: Mapping[str, object], dry_run: bool) -> None:
+    resolve(operation)(options, dry_run=dry_run)
+
+
+def resolve(operation: str) -> OperationHandler:
+    """Return the handler for ``operation`` so callers can validate plans up front."""
 
     try:
-        handler = operations[operation]
-    except KeyError as exc:  # pragma: no cover - defensive
+        return _OPERATIONS[operation]
+    except KeyError as exc:
         raise RuntimeError(f"Unsupported service operation '{operation}'") from exc
 
-    handler(options, dry_run=dry_run)
-
 
 def _configure_postgresql(options: Mapping[str, object], *, dry_run: bool) -> None:
     host = _require(options, "host")
@@ -221,3 +213,18 @@ def _as_list(value: object) -> list[str]:
 def _emit(dry_run: bool, provider: str, operation: str, description: str) -> None:
     prefix = "DRY-RUN" if dry_run else "EXEC"
     print(f"[{prefix}] {provider}:{operation} {description}")
+
+
+# Built once at import; handlers are module-level functions defined above.
+_OPERATIONS: dict[str, OperationHandler] = {
+    "configure_postgresql": _configure_postgresql,
+    "configure_gitea": _configure_gitea,
+    "configure_vaultwarden": _configure_vaultwarden,
+    "configure_prometheus": _configure_prometheus,
+    "configure_loki": _configure_loki,
+    "configure_grafana": _configure_grafana,
+    "configure_vector_db": _configure_vector_db,
+    "bootstrap_vector_collections": _bootstrap_vector_collections,
+    "register_vector_pipelines": _register_vector_pipelines,
+    "register_prometheus_targets": _register_prometheus_targets,
+}
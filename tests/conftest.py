@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_profile_cache(tmp_path, monkeypatch):
+    # Profile.load caches parsed profiles on disk; keep that out of the real home directory.
+    monkeypatch.setenv("RALF_CACHE_DIR", str(tmp_path / "ralf-cache"))
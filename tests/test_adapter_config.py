@@ -0,0 +1,128 @@
+import asyncio
+import os
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from ralf_adapter.config import AdapterConfig, SecretResolver  # noqa: E402
+from ralf_adapter.vault import VaultSecretReference  # noqa: E402
+
+
+CONFIG_TEXT = """
+default_endpoint: local
+endpoints:
+  local:
+    url: http://llm.lab.local/v1/generate
+    parameters:
+      temperature: 0.2
+"""
+
+
+def test_from_path_reuses_parse_and_isolates_mutation(tmp_path):
+    config_path = tmp_path / "adapter.yaml"
+    config_path.write_text(CONFIG_TEXT, encoding="utf-8")
+
+    first = AdapterConfig.from_path(config_path)
+    first.endpoints["local"].default_parameters["temperature"] = 1.0
+
+    second = AdapterConfig.from_path(config_path)
+    assert second.endpoints["local"].default_parameters["temperature"] == 0.2
+
+
+def test_from_path_picks_up_changed_file(tmp_path):
+    config_path = tmp_path / "adapter.yaml"
+    config_path.write_text(CONFIG_TEXT, encoding="utf-8")
+    AdapterConfig.from_path(config_path)
+
+    config_path.write_text(CONFIG_TEXT.replace("0.2", "0.75"), encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = AdapterConfig.from_path(config_path)
+    assert reloaded.endpoints["local"].default_parameters["temperature"] == 0.75
+
+
+class _CountingVault:
+    def __init__(self):
+        self.batches = []
+
+    def read_secrets_batch(self, references):
+        references = list(references)
+        self.batches.append(references)
+        return {ref: f"{ref.cipher_id}:{ref.field}" for ref in references}
+
+    def read_secret(self, reference):  # pragma: no cover - must not be reached
+        raise AssertionError("prefetched secrets must not be fetched again")
+
+
+def test_resolver_serves_prefetched_vault_secrets():
+    token = VaultSecretReference.parse("vault://llm/shared/api-token")
+    field = VaultSecretReference.parse("vault://llm/shared/field:api-key")
+    vault = _CountingVault()
+    resolver = SecretResolver(vault_provider=vault)
+
+    resolver.prefetch([token, field, token])
+
+    assert len(vault.batches) == 1
+    assert resolver.resolve(token) == "llm/shared:api-token"
+    assert resolver.resolve(field) == "llm/shared:api-key"
+
+
+def test_resolve_reuses_unchanged_endpoints():
+    data = {
+        "endpoints": {
+            "stable": {"url": "http://a.lab.local", "headers": {"X-API-Key": "env://STABLE_KEY"}},
+            "moving": {"url": "http://b.lab.local", "timeout": 10},
+        }
+    }
+    previous = AdapterConfig.from_mapping(data).resolve(env={"STABLE_KEY": "secret"})
+
+    data["endpoints"]["moving"]["timeout"] = 20
+    # STABLE_KEY is gone from the environment: reusing must not look it up again.
+    reloaded = AdapterConfig.from_mapping(data).resolve(env={}, previous=previous)
+
+    assert reloaded.endpoints["stable"] is previous.endpoints["stable"]
+    assert reloaded.endpoints["moving"].timeout == 20
+    assert list(reloaded.endpoints) == ["stable", "moving"]
+
+
+def test_from_path_async_matches_sync_loader(tmp_path):
+    config_path = tmp_path / "adapter.yaml"
+    config_path.write_text(CONFIG_TEXT, encoding="utf-8")
+
+    loaded = asyncio.run(AdapterConfig.from_path_async(config_path))
+
+    assert loaded == AdapterConfig.from_path(config_path)
+
+
+def test_secret_values_only_cover_fields_used_by_the_auth_scheme():
+    config = AdapterConfig.from_mapping(
+        {
+            "endpoints": {
+                "bearer": {
+                    "url": "http://bearer",
+                    "auth": {
+                        "type": "bearer",
+                        "token": "vault://cipher/token",
+                        "username": "vault://dangling/username",
+                    },
+                },
+                "basic": {
+                    "url": "http://basic",
+                    "auth": {
+                        "type": "basic",
+                        "token": "vault://dangling/token",
+                        "username": "vault://cipher/user",
+                        "password": "vault://cipher/pass",
+                    },
+                },
+            }
+        }
+    )
+
+    fields = {
+        name: [value.field for value in endpoint.secret_values()]
+        for name, endpoint in config.endpoints.items()
+    }
+    assert fields == {"bearer": ["token"], "basic": ["user", "pass"]}
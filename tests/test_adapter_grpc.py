@@ -0,0 +1,44 @@
+import asyncio
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from google.protobuf import struct_pb2  # noqa: E402
+
+from ralf_adapter.grpc_server import AdapterGrpcServer  # noqa: E402
+from ralf_adapter.service import AdapterError  # noqa: E402
+
+
+class _RecordingService:
+    def __init__(self):
+        self.inputs = []
+
+    async def generate(self, generation_input):
+        self.inputs.append(generation_input)
+        raise AdapterError("stop")
+
+
+class _Context:
+    def set_code(self, code):
+        self.code = code
+
+    def set_details(self, details):
+        self.details = details
+
+
+def _call(server, **fields):
+    request = struct_pb2.Struct()
+    request.update(fields)
+    return asyncio.run(server._generate(request, _Context()))
+
+
+def test_generate_drops_non_object_messages():
+    service = _RecordingService()
+    server = AdapterGrpcServer(service)
+
+    _call(server, prompt="Hallo", messages=[{"role": "user", "content": "Hi"}, "noise", 3])
+    _call(server, prompt="Hallo", messages=["noise"])
+
+    assert service.inputs[0].messages == [{"role": "user", "content": "Hi"}]
+    assert service.inputs[1].messages is None
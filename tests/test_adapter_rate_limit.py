@@ -0,0 +1,32 @@
+import asyncio
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from ralf_adapter.rate_limit import RateLimiter  # noqa: E402
+
+
+def test_try_acquire_drains_bucket():
+    async def scenario():
+        limiter = RateLimiter.per_minute(2)
+        return [await limiter.try_acquire() for _ in range(3)]
+
+    assert asyncio.run(scenario()) == [True, True, False]
+
+
+def test_acquire_serves_waiters_in_order():
+    async def scenario():
+        limiter = RateLimiter(capacity=1, refill_seconds=0.01)
+        order = []
+
+        async def worker(index):
+            await limiter.acquire()
+            order.append(index)
+
+        await asyncio.gather(*(worker(index) for index in range(4)))
+        return order, await limiter.try_acquire()
+
+    order, opportunistic = asyncio.run(scenario())
+    assert order == [0, 1, 2, 3]
+    assert opportunistic is False
@@ -0,0 +1,112 @@
+import asyncio
+import json
+import pathlib
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from ralf_adapter.config import AdapterConfig  # noqa: E402
+from ralf_adapter.service import (  # noqa: E402
+    AdapterError,
+    GenerationInput,
+    LLMAdapterService,
+    _build_payload,
+    _extract_text,
+)
+
+
+def _endpoint(**entry):
+    entry.setdefault("url", "http://llm.lab.local/v1/generate")
+    config = AdapterConfig.from_mapping({"endpoints": {"test": entry}})
+    return config.resolve(env={}).get_endpoint("test")
+
+
+def test_openai_payload_merges_defaults_and_request_parameters():
+    endpoint = _endpoint(
+        protocol="openai",
+        model="gpt-4o-mini",
+        parameters={"temperature": 0.2, "top_p": 0.9},
+    )
+    request = GenerationInput(prompt="Hallo", parameters={"temperature": 0.7})
+
+    payload = _build_payload(endpoint, request)
+
+    assert payload == {
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "user", "content": "Hallo"}],
+        "temperature": 0.7,
+        "top_p": 0.9,
+    }
+    assert endpoint.default_parameters == {"temperature": 0.2, "top_p": 0.9}
+
+
+def test_openai_payload_requires_model():
+    endpoint = _endpoint(protocol="openai")
+    with pytest.raises(AdapterError):
+        _build_payload(endpoint, GenerationInput(prompt="Hallo"))
+
+
+def test_generic_payload_nests_parameters():
+    endpoint = _endpoint(parameters={"temperature": 0.2})
+
+    payload = _build_payload(endpoint, GenerationInput(prompt="Hallo", metadata={"trace": "1"}))
+    assert payload == {
+        "prompt": "Hallo",
+        "parameters": {"temperature": 0.2},
+        "metadata": {"trace": "1"},
+    }
+    request = GenerationInput(prompt="Hallo", parameters={"temperature": 1.0})
+    overridden = _build_payload(endpoint, request)
+    assert overridden["parameters"] == {"temperature": 1.0}
+    assert endpoint.default_parameters == {"temperature": 0.2}
+
+
+def test_extract_text_per_protocol():
+    assert _extract_text("openai", {"choices": [{"message": {"content": "chat"}}]}) == "chat"
+    assert _extract_text("openai", {"choices": [{"text": "legacy"}]}) == "legacy"
+    assert _extract_text("generic", {"completion": {"text": "nested"}}) == "nested"
+    assert _extract_text("generic", {"text": "flat"}) == "flat"
+    with pytest.raises(AdapterError):
+        _extract_text("openai", {"choices": []})
+
+
+def _service_with_transport(handler, **entry):
+    entry.setdefault("url", "http://llm.lab.local/v1/generate")
+    service = LLMAdapterService(AdapterConfig.from_mapping({"endpoints": {"test": entry}}))
+    service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return service
+
+
+def test_generate_returns_normalised_result():
+    def handler(request):
+        assert json.loads(request.content) == {"prompt": "Hallo"}
+        return httpx.Response(200, json={"text": "Antwort", "usage": {"tokens": 3}})
+
+    async def scenario():
+        service = _service_with_transport(handler)
+        try:
+            return await service.generate(GenerationInput(prompt="Hallo"))
+        finally:
+            await service.aclose()
+
+    result = asyncio.run(scenario())
+    assert (result.text, result.endpoint, result.usage) == ("Antwort", "test", {"tokens": 3})
+
+
+def test_generate_truncates_upstream_error_body():
+    def handler(request):
+        return httpx.Response(500, content=b"x" * 100_000)
+
+    async def scenario():
+        service = _service_with_transport(handler)
+        try:
+            await service.generate(GenerationInput(prompt="Hallo"))
+        finally:
+            await service.aclose()
+
+    with pytest.raises(AdapterError) as excinfo:
+        asyncio.run(scenario())
+    assert str(excinfo.value) == "Endpoint 'test' returned HTTP 500: " + "x" * 200
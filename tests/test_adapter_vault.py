@@ -0,0 +1,67 @@
+import pathlib
+import sys
+
+import httpx
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from ralf_adapter import vault  # noqa: E402
+from ralf_adapter.vault import VaultSecretReference, VaultwardenSecretProvider  # noqa: E402
+
+
+CIPHERS = {
+    "llm-openai": {"id": "llm-openai", "login": {"password": "sk-openai"}},
+    "llm-ollama": {"id": "llm-ollama", "fields": [{"name": "api-key", "value": "ollama-key"}]},
+}
+
+
+def _provider(*, bulk_status=200):
+    requested = []
+
+    def handler(request):
+        requested.append(request.url.path)
+        if request.url.path == "/api/ciphers":
+            return httpx.Response(bulk_status, json={"data": list(CIPHERS.values())})
+        cipher_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json=CIPHERS[cipher_id])
+
+    client = httpx.Client(base_url="http://vault.lab.local", transport=httpx.MockTransport(handler))
+    return VaultwardenSecretProvider("http://vault.lab.local", "token", client=client), requested
+
+
+REFERENCES = [
+    VaultSecretReference.parse("vault://llm-openai/api-token"),
+    VaultSecretReference.parse("vault://llm-ollama/field:api-key"),
+]
+
+
+def test_batch_uses_bulk_listing():
+    provider, requested = _provider()
+
+    secrets = provider.read_secrets_batch(REFERENCES)
+
+    assert list(secrets.values()) == ["sk-openai", "ollama-key"]
+    assert requested == ["/api/ciphers"]
+
+
+def test_batch_falls_back_to_single_ciphers_when_listing_is_refused():
+    provider, requested = _provider(bulk_status=403)
+
+    secrets = provider.read_secrets_batch(REFERENCES)
+
+    assert list(secrets.values()) == ["sk-openai", "ollama-key"]
+    assert requested == ["/api/ciphers", "/api/ciphers/llm-openai", "/api/ciphers/llm-ollama"]
+
+
+def test_shared_client_is_replaced_when_the_token_rotates(monkeypatch):
+    monkeypatch.setattr(vault, "_SHARED_CLIENTS", {})
+
+    first = vault.get_shared_client("http://vault.lab.local/", "old-token")
+    assert vault.get_shared_client("http://vault.lab.local", "old-token") is first
+
+    rotated = vault.get_shared_client("http://vault.lab.local", "new-token")
+    assert rotated is not first
+    assert first.is_closed
+    assert rotated.headers["Authorization"] == "Bearer new-token"
+    assert len(vault._SHARED_CLIENTS) == 1
+    rotated.close()
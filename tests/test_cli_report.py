@@ -0,0 +1,140 @@
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from ralf_installer import cli  # noqa: E402
+from ralf_installer.installer import ExecutionReport  # noqa: E402
+
+
+PROFILE_PATH = pathlib.Path(__file__).resolve().parents[1] / "installer" / "profiles" / "core.yaml"
+
+
+def _write_results(results_dir):
+    results_dir.mkdir()
+    (results_dir / "b-backups.json").write_text(
+        json.dumps({"status": "fail", "summary": "snapshot missing"}), encoding="utf-8"
+    )
+    (results_dir / "a-secrets.json").write_text(
+        json.dumps({"policy": "secret-rotation", "status": "pass", "severity": 2}),
+        encoding="utf-8",
+    )
+    (results_dir / "notes.txt").write_text("ignored", encoding="utf-8")
+
+
+def test_collect_policy_results_orders_and_normalises(tmp_path):
+    results_dir = tmp_path / "policy_results"
+    _write_results(results_dir)
+
+    results = cli._collect_policy_results(results_dir)
+
+    assert [result.as_dict() for result in results] == [
+        {
+            "policy": "secret-rotation",
+            "status": "PASS",
+            "severity": "2",
+            "source": str(results_dir / "a-secrets.json"),
+        },
+        {
+            "policy": "b-backups",
+            "status": "FAIL",
+            "details": "snapshot missing",
+            "source": str(results_dir / "b-backups.json"),
+        },
+    ]
+
+
+def test_report_command_emits_json(tmp_path, capsys):
+    results_dir = tmp_path / "policy_results"
+    _write_results(results_dir)
+
+    exit_code = cli.main(
+        ["report", str(PROFILE_PATH), "--results-dir", str(results_dir), "--json"]
+    )
+
+    payload = json.loads(capsys.readouterr().out)
+    assert exit_code == 0
+    assert payload["profile"] == "core"
+    assert [entry["policy"] for entry in payload["results"]] == ["secret-rotation", "b-backups"]
+
+
+def test_large_execution_report_streams_identical_json(capsys):
+    names = [f"component-{index}" for index in range(400)]
+    report = ExecutionReport(
+        planned_components=names,
+        executed_components=names,
+        skipped_components=[],
+    )
+
+    cli._print_json(report)
+
+    assert capsys.readouterr().out == json.dumps(report.as_dict(), indent=2) + "\n"
+
+
+def test_enable_workflows_filters_runtime_and_loops_case_insensitively(capsys):
+    exit_code = cli.main(
+        ["enable-workflows", str(PROFILE_PATH), "--runtime", "n8n", "--loop", "MAIN"]
+    )
+
+    out = capsys.readouterr().out
+    assert exit_code == 0
+    assert "Activating n8n workflow 'Main Health Loop Orchestration' for loop 'main'" in out
+    activated = [line for line in out.splitlines() if line.startswith("Activating")]
+    assert all(line.endswith("for loop 'main'") for line in activated)
+
+
+def test_help_does_not_import_yaml():
+    src = pathlib.Path(__file__).resolve().parents[1] / "src"
+    probe = (
+        "import sys\n"
+        "from ralf_installer import cli\n"
+        "try:\n"
+        "    cli.main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('yaml' in sys.modules, 'ralf_installer.config' in sys.modules)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", probe],
+        env={"PYTHONPATH": str(src)},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    assert output.splitlines()[-1] == "False False"
+
+
+def test_small_execution_report_matches_stdlib_layout(capsys):
+    report = ExecutionReport(
+        planned_components=["db", "app"],
+        executed_components=["db"],
+        skipped_components=[],
+    )
+
+    cli._print_json(report)
+
+    assert capsys.readouterr().out == json.dumps(report.as_dict(), indent=2) + "\n"
+
+
+def test_report_command_with_bare_profile_name_keeps_relative_sources(
+    tmp_path, monkeypatch, capsys
+):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "core.yaml").write_text(PROFILE_PATH.read_text(encoding="utf-8"), encoding="utf-8")
+    _write_results(tmp_path / "policy_results")
+
+    expected = [
+        os.path.join("policy_results", "a-secrets.json"),
+        os.path.join("policy_results", "b-backups.json"),
+    ]
+    for profile_arg in ("core.yaml", os.path.join(".", "core.yaml")):
+        exit_code = cli.main(["report", profile_arg, "--json"])
+
+        payload = json.loads(capsys.readouterr().out)
+        assert exit_code == 0
+        assert [entry["source"] for entry in payload["results"]] == expected
+
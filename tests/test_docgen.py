@@ -0,0 +1,99 @@
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from ralf_installer import docgen  # noqa: E402
+from ralf_installer.config import Component, Profile  # noqa: E402
+from ralf_installer.installer import ExecutionReport, Installer  # noqa: E402
+
+
+def _installer():
+    profile = Profile(
+        name="Demo | <Lab>",
+        description="Testprofil",
+        components=[
+            Component.from_mapping(
+                {
+                    "name": "db",
+                    "tasks": ["install", "tune"],
+                    "actions": [{"provider": "service", "operation": "configure"}],
+                }
+            ),
+            Component.from_mapping({"name": "app", "depends_on": ["db"]}),
+        ],
+    )
+    return Installer(profile, dry_run=True)
+
+
+def test_generate_documentation_renders_markdown_and_html(tmp_path):
+    installer = _installer()
+    report = ExecutionReport(["db", "app"], [], ["db", "app"])
+
+    markdown_path, html_path = docgen.generate_documentation(
+        installer, report, output_dir=tmp_path
+    )
+
+    assert markdown_path.name == "demo-lab.md" and html_path.name == "demo-lab.html"
+    markdown = markdown_path.read_text(encoding="utf-8")
+    assert markdown.startswith("# Installer Report: Demo | <Lab>\n")
+    assert "| db | — | • install<br>• tune | — | • service:configure | — |" in markdown
+    assert markdown.endswith("_Keine Vector-Bootstrap-Einträge gefunden._\n")
+
+    html_output = html_path.read_text(encoding="utf-8")
+    assert "<title>Installer Report: Demo | &lt;Lab&gt;</title>" in html_output
+    assert "<td>install<br>tune</td>" in html_output
+    assert html_output.endswith("</section>\n  </body>\n</html>\n")
+
+
+def test_generate_documentation_skips_unchanged_inputs(tmp_path, monkeypatch):
+    installer = _installer()
+    report = ExecutionReport(["db", "app"], [], ["db", "app"])
+    docgen.generate_documentation(installer, report, output_dir=tmp_path)
+    assert (tmp_path / "demo-lab.hash").exists()
+
+    rendered = []
+    original = docgen._render_markdown
+
+    def tracking(context, write):
+        rendered.append(context.report)
+        original(context, write)
+
+    monkeypatch.setattr(docgen, "_render_markdown", tracking)
+    docgen.generate_documentation(installer, report, output_dir=tmp_path)
+    assert rendered == []
+
+    # Code changes in any module feeding the renderers invalidate the sidecar.
+    monkeypatch.setattr(docgen, "_SOURCE_STAMP", docgen._SOURCE_STAMP + ";changed")
+    docgen.generate_documentation(installer, report, output_dir=tmp_path)
+    assert rendered == [report]
+    rendered.clear()
+
+    changed = ExecutionReport(["db", "app"], ["db", "app"], [])
+    markdown_path, _ = docgen.generate_documentation(installer, changed, output_dir=tmp_path)
+    assert rendered == [changed]
+    assert "- Ausgeführte Komponenten: `db`, `app`" in markdown_path.read_text(encoding="utf-8")
+
+
+def test_failed_render_keeps_previous_documents(tmp_path, monkeypatch):
+    installer = _installer()
+    report = ExecutionReport(["db", "app"], [], ["db", "app"])
+    markdown_path, html_path = docgen.generate_documentation(
+        installer, report, output_dir=tmp_path
+    )
+    previous = markdown_path.read_text(encoding="utf-8")
+
+    def failing(context, write):
+        write("# partial")
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(docgen, "_render_markdown", failing)
+    changed = ExecutionReport(["db", "app"], ["db", "app"], [])
+    with pytest.raises(RuntimeError, match="boom"):
+        docgen.generate_documentation(installer, changed, output_dir=tmp_path)
+
+    assert markdown_path.read_text(encoding="utf-8") == previous
+    assert not (tmp_path / "demo-lab.hash").exists()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["demo-lab.html", "demo-lab.md"]
@@ -0,0 +1,43 @@
+import json
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from ralf_installer import explainability  # noqa: E402
+
+
+def test_parse_collections_reuses_specs_for_identical_definitions():
+    def definitions():
+        return [
+            {"name": "docs", "dimensions": 768, "metadata": [{"team": "core"}, {"env": "lab"}]},
+            {"name": "logs", "dimensions": "384", "on_disk": True},
+        ]
+
+    first = explainability.parse_collections(definitions())
+    second = explainability.parse_collections(iter(definitions()))
+
+    assert first == second and first is not second
+    assert all(a is b for a, b in zip(first, second))
+    assert first[0].metadata == {"team": "core", "env": "lab"}
+    assert first[1].dimensions == 384 and first[1].on_disk
+
+    reordered = definitions()
+    reordered[0]["metadata"] = [{"env": "lab"}, {"team": "core"}]
+    assert list(explainability.parse_collections(reordered)[0].metadata) == ["env", "team"]
+    assert explainability.parse_collections([{"name": True, "dimensions": 1}])[0].name == "True"
+    assert explainability.parse_collections([{"name": 1, "dimensions": 1}])[0].name == "1"
+
+
+def test_report_to_json_matches_as_dict():
+    summary = explainability.build_bootstrap_summary(
+        "qdrant.lab",
+        6333,
+        6334,
+        [{"name": "docs", "dimensions": 768, "metadata": [{"team": "kern"}]}],
+        pipelines=[{"name": "ingest", "target_collection": "docs", "source": "git"}],
+    )
+    report = explainability.render_report("core", "Kernprofil", [summary])
+
+    assert json.loads(report.to_json()) == report.as_dict()
+    assert b'"on_disk"' not in report.to_json()
@@ -0,0 +1,187 @@
+import json
+import pathlib
+import stat
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from ralf_installer import config  # noqa: E402
+from ralf_installer import installer as installer_module  # noqa: E402
+from ralf_installer.config import ConfigurationError, Profile  # noqa: E402
+from ralf_installer.installer import ExecutionReport, Installer  # noqa: E402
+
+
+PROFILE_YAML = """
+name: demo
+description: Demo
+components:
+  - name: base
+    tasks: [prepare]
+  - name: app
+    depends_on: [base]
+scheduler:
+  loops:
+    main:
+      triggers:
+        - type: timer
+          every: 5m
+"""
+
+
+def test_profile_load_reuses_disk_cache_until_file_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv("RALF_CACHE_DIR", str(tmp_path / "cache"))
+    profile_path = tmp_path / "profile.yaml"
+    profile_path.write_text(PROFILE_YAML, encoding="utf-8")
+
+    first = Profile.load(profile_path)
+    parses = []
+    original = Profile._parse
+
+    def tracking(path):
+        parses.append(path)
+        return original(path)
+
+    monkeypatch.setattr(Profile, "_parse", tracking)
+    cached = Profile.load(profile_path)
+    assert parses == []
+    assert cached == first and cached is not first
+    with pytest.raises(TypeError):
+        cached.scheduler.loops["other"] = cached.scheduler.loops["main"]
+
+    profile_path.write_text(PROFILE_YAML.replace("Demo", "Changed demo"), encoding="utf-8")
+    assert Profile.load(profile_path).description == "Changed demo"
+    assert parses == [profile_path]
+    # The entry for the previous file state is replaced, not accumulated.
+    assert len(list((tmp_path / "cache").glob("profile-*.pkl"))) == 1
+
+
+def test_profile_cache_skips_tampered_or_shared_entries(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("RALF_CACHE_DIR", str(cache_dir))
+    profile_path = tmp_path / "profile.yaml"
+    profile_path.write_text(PROFILE_YAML, encoding="utf-8")
+    Profile.load(profile_path)
+    assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+
+    (entry,) = cache_dir.glob("profile-*.pkl")
+    data = entry.read_bytes()
+    entry.write_bytes(data[:-1] + bytes([data[-1] ^ 1]))
+    parses = []
+    original = Profile._parse
+
+    def tracking(path):
+        parses.append(path)
+        return original(path)
+
+    monkeypatch.setattr(Profile, "_parse", tracking)
+    Profile.load(profile_path)
+    Profile.load(profile_path)
+    assert parses == [profile_path]
+
+    cache_dir.chmod(0o770)
+    Profile.load(profile_path)
+    assert parses == [profile_path, profile_path]
+
+
+def test_profile_cache_can_be_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("RALF_CACHE_DIR", "")
+    profile_path = tmp_path / "profile.yaml"
+    profile_path.write_text(PROFILE_YAML, encoding="utf-8")
+
+    assert config._profile_cache_file(profile_path, profile_path.stat()) is None
+    assert Profile.load(profile_path).name == "demo"
+
+
+def _profile(*components):
+    return Profile(
+        name="demo",
+        description="",
+        components=[config.Component.from_mapping(entry) for entry in components],
+    )
+
+
+def test_resolve_dependencies_orders_dependencies_first():
+    profile = _profile(
+        {"name": "app", "depends_on": ["db", "cache"]},
+        {"name": "cache"},
+        {"name": "db", "depends_on": ["cache"]},
+        {"name": "ui", "depends_on": ["app"]},
+    )
+
+    assert [component.name for component in profile.resolve_dependencies()] == [
+        "cache",
+        "db",
+        "app",
+        "ui",
+    ]
+
+
+def test_resolve_dependencies_keeps_depth_first_order_for_unsorted_profiles():
+    profile = _profile(
+        {"name": "app", "depends_on": ["db"]},
+        {"name": "monitor"},
+        {"name": "db"},
+    )
+
+    assert [component.name for component in profile.resolve_dependencies()] == [
+        "db",
+        "app",
+        "monitor",
+    ]
+
+
+def test_resolve_dependencies_reports_cycles_and_unknown_components():
+    cyclic = _profile(
+        {"name": "a", "depends_on": ["b"]},
+        {"name": "b", "depends_on": ["a"]},
+        {"name": "c"},
+    )
+    with pytest.raises(ConfigurationError, match="involving 'a'"):
+        cyclic.resolve_dependencies()
+
+    with pytest.raises(ConfigurationError, match="unknown component 'missing'"):
+        _profile({"name": "a", "depends_on": ["missing"]}).resolve_dependencies()
+
+
+def test_installer_plan_resolves_dependencies_once(monkeypatch):
+    profile = _profile({"name": "app", "depends_on": ["db"]}, {"name": "db"})
+    installer = Installer(profile)
+    calls = []
+    original = Profile.resolve_dependencies
+
+    def tracking(self):
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(Profile, "resolve_dependencies", tracking)
+    first = installer.plan()
+    first.clear()
+
+    assert [component.name for component in installer.plan()] == ["db", "app"]
+    assert calls == [profile]
+
+
+def test_execute_rejects_unknown_operations_before_running_anything(capsys):
+    profile = _profile(
+        {"name": "db", "tasks": ["install"]},
+        {
+            "name": "app",
+            "depends_on": ["db"],
+            "actions": [{"provider": "service", "operation": "configure_unknown"}],
+        },
+    )
+
+    with pytest.raises(RuntimeError, match="Unsupported service operation 'configure_unknown'"):
+        Installer(profile, dry_run=True).execute()
+    assert "db: install" not in capsys.readouterr().out
+
+
+def test_execution_report_to_json_matches_as_dict(monkeypatch):
+    report = ExecutionReport(["db", "app"], ["db"], ["app"])
+    encoded = report.to_json()
+
+    assert json.loads(encoded) == report.as_dict()
+    monkeypatch.setattr(installer_module, "orjson", None)
+    assert report.to_json() == encoded